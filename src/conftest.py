@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures for the tests of the movie data analysis module.
+"""
+import pytest
+from movie_data_analysis import MovieDataAnalyzer
+
+
+@pytest.fixture(scope="session")
+def analyzer() -> MovieDataAnalyzer:
+    """
+    Creates one MovieDataAnalyzer for the whole test session, so the dataset
+    is downloaded and loaded only once however many tests use it.
+
+    Returns:
+        MovieDataAnalyzer: The shared analyzer.
+    """
+    return MovieDataAnalyzer()
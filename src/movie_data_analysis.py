@@ -9,16 +9,261 @@ datasets by:
 - Creating necessary directory structures for data storage
 - Downloading data from specified URLs
 - Extracting compressed data files (tar.gz format)
+
+If numba is installed, the first height distribution sets the process-wide
+numba.config.THREADING_LAYER_PRIORITY to prefer OpenMP, unless the
+NUMBA_THREADING_LAYER_PRIORITY environment variable chooses the order.
 """
 
+import hashlib
+import json
 import os
+import re
+import shutil
+import subprocess
 import tarfile
-from typing import Optional, Union
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import NamedTuple, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from pydantic import BaseModel, PositiveInt, Field
 
+try:
+    # Optional: inflates gzip archives in parallel on all available cores
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    # Optional: compiles the height histogram kernel to parallel machine code
+    import numba
+except ImportError:
+    numba = None
+
+# Native tar with the multithreaded pigz decompressor, if both are installed
+TAR_PATH = shutil.which("tar")
+UNPIGZ_PATH = shutil.which("unpigz")
+PARALLEL_GZIP = rapidgzip is not None or bool(TAR_PATH and UNPIGZ_PATH)
+
+# Largest archive that is buffered in memory and extracted with random
+# access when no parallel decompressor is available
+SPOOL_MAX_SIZE = 64 << 20
+
+# Arrow types used to parse the columns of the data files
+ARROW_TYPES = {
+    "int32": pa.int32(),
+    "float32": pa.float32(),
+    "float64": pa.float64(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "large_string": pa.large_string(),
+    str: pa.string(),
+}
+
+# pandas types of the Arrow string columns, which keep the strings in their
+# Arrow buffers instead of converting them to Python objects
+PANDAS_STRING_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.ArrowDtype(pa.large_string()),
+}
+
+# Directory of the Parquet copies of the parsed data files, inside the
+# dataset directory, and their compression (zstd if this Arrow build has it)
+PARQUET_CACHE_DIR = "_parquet_cache"
+PARQUET_COMPRESSION = "zstd" if pa.Codec.is_available("zstd") else "snappy"
+
+# Version of the cached DataFrames, to increase when the parsing of the data
+# files changes in a way DATA_FILES does not show
+PARQUET_CACHE_VERSION = 1
+
+# Timeouts in seconds (to connect, to read the reply) of the check for a new
+# version of the dataset. It is tried once, without the retries of the
+# download, so an unresponsive server only delays the start briefly.
+VERSION_CHECK_TIMEOUT = (3.05, 3)
+
+# Manifest written into the dataset directory once the archive has been fully
+# extracted, recording the archive version and the extracted files
+MANIFEST_FILE = "manifest.json"
+
+# Genre name of each Freebase ID:name tuple in the movie_genres column,
+# whether or not the JSON has a space after the colon
+GENRE_PATTERN = re.compile(r'":\s*"([^"]+)"')
+
+
+class DataFile(NamedTuple):
+    """
+    Layout of a data file of the dataset and how it is loaded.
+    """
+    attribute: str  # Attribute of MovieDataAnalyzer the DataFrame is stored in
+    names: list[str]  # Column names from the dataset README
+    dtype: Union[dict, type]  # Type of each column, or one for all columns
+    usecols: Optional[list[str]] = None  # Columns to keep, default is all
+    dates: tuple[str, ...] = ()  # Columns parsed with parse_dates
+
+
+# Data files of the dataset, looked up by file name
+DATA_FILES = {
+    ###
+    # Column names from README:
+    # 1. Wikipedia movie ID, 2. Freebase movie ID,
+    # 3. Movie release date, 4. Character name,
+    # 5. Actor date of birth, 6. Actor gender,
+    # 7. Actor height (in meters),
+    # 8. Actor ethnicity (Freebase ID), 9. Actor name,
+    # 10. Actor age at movie release,
+    # 11. Freebase character/actor map ID,
+    # 12. Freebase character ID, 13. Freebase actor ID
+    ###
+    "character.metadata.tsv": DataFile(
+        attribute="characters",
+        names=[
+            "wikipedia_movie_id", "freebase_movie_id",
+            "movie_release_date", "character_name",
+            "actor_date_of_birth", "actor_gender", "actor_height",
+            "actor_ethnicity", "actor_name",
+            "actor_age_at_movie_release",
+            "freebase_character_actor_map_id",
+            "freebase_character_id", "freebase_actor_id"
+        ],
+        usecols=[
+            # Only the columns used by the analysis methods
+            "wikipedia_movie_id", "actor_date_of_birth",
+            "actor_gender", "actor_height"
+        ],
+        dtype={
+            "wikipedia_movie_id": "int32",
+            "actor_date_of_birth": str,
+            "actor_gender": "category",
+            "actor_height": "float32"
+        },
+        dates=("actor_date_of_birth",)
+    ),
+    ###
+    # Column names from README:
+    # 1. Wikipedia movie ID, 2. Freebase movie ID, 3. Movie name,
+    # 4. Movie release date, 5. Movie box office revenue,
+    # 6. Movie runtime,
+    # 7. Movie languages (Freebase ID:name tuples),
+    # 8. Movie countries (Freebase ID:name tuples),
+    # 9. Movie genres (Freebase ID:name tuples)
+    ###
+    "movie.metadata.tsv": DataFile(
+        attribute="movie_metadata",
+        names=[
+            "wikipedia_movie_id", "freebase_movie_id", "movie_name",
+            "movie_release_date", "movie_box_office_revenue",
+            "movie_runtime", "movie_languages", "movie_countries",
+            "movie_genres"
+        ],
+        dtype={
+            "wikipedia_movie_id": "int32", "freebase_movie_id": str,
+            "movie_name": str, "movie_release_date": str,
+            "movie_box_office_revenue": "float64",
+            "movie_runtime": "float32",
+            # Many movies share the same combination of languages,
+            # countries or genres
+            "movie_languages": "category", "movie_countries": "category",
+            # Genre combinations are more varied, but _genres parses each
+            # distinct one once and gathers the results by category code
+            "movie_genres": "category"
+        },
+        dates=("movie_release_date",)
+    ),
+    # Column names from README: 1. Name, 2. Actor ID
+    "name.clusters.txt": DataFile(
+        attribute="name_clusters",
+        names=["name", "actor_id"],
+        # Several actors share a character name
+        dtype={"name": "category", "actor_id": str}
+    ),
+    # Column names from README: 1. Wikipedia movie ID, 2. Plot summary
+    "plot_summaries.txt": DataFile(
+        attribute="plot_summaries",
+        names=["wikipedia_movie_id", "summary"],
+        # Plots are long, so they are kept in one Arrow buffer with 64-bit
+        # offsets rather than as separate Python strings
+        dtype={"wikipedia_movie_id": "int32", "summary": "large_string"}
+    ),
+    # Column names from README: Cluster ID and Name
+    "tvtropes.clusters.txt": DataFile(
+        attribute="tvtropes_clusters",
+        names=["name", "cluster"],
+        # Each of the few dozen tropes is repeated for all its characters
+        dtype={"name": "category", "cluster": str}
+    ),
+}
+
+
+if numba is not None:
+    @lru_cache(maxsize=None)
+    def configure_numba():
+        """
+        Chooses the numba threading layer before the first parallel kernel
+        runs, rather than on import, as the setting is process-wide.
+        """
+        if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+            # Prefer OpenMP: the TBB layer can hang at interpreter exit once
+            # a kernel has run outside the main thread, as in the Streamlit
+            # app
+            numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb",
+                                                     "workqueue"]
+
+    @numba.njit(parallel=True, cache=True)
+    def height_histogram(heights, genders, min_height, max_height,
+                         gender_code, edges, n_chunks):
+        """
+        Counts the heights within [min_height, max_height] of the actors of
+        one gender (all genders if gender_code is -1) into the bins given by
+        edges, in a single fused pass over the arrays.
+
+        The arrays are split into n_chunks chunks (one per thread), each
+        counting into its own row of bins, so no two threads update the same
+        counter.
+        """
+        bins = edges.size - 1
+        scale = bins / (edges[-1] - edges[0])
+        chunk_size = (heights.size + n_chunks - 1) // n_chunks
+        partial_counts = np.zeros((n_chunks, bins), dtype=np.int64)
+        for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+            stop = min((chunk + 1) * chunk_size, heights.size)
+            for i in range(chunk * chunk_size, stop):
+                height = heights[i]
+                if not min_height <= height <= max_height or (
+                        gender_code != -1 and genders[i] != gender_code):
+                    continue
+                # Same bin as np.histogram, whose last bin is closed
+                index = min(int((height - edges[0]) * scale), bins - 1)
+                if height < edges[index]:
+                    index -= 1
+                elif index < bins - 1 and height >= edges[index + 1]:
+                    index += 1
+                partial_counts[chunk, index] += 1
+        return partial_counts.sum(axis=0)
+else:
+    configure_numba = None  # pylint: disable=invalid-name
+    height_histogram = None  # pylint: disable=invalid-name
+
+
+def numpy_height_histogram(heights, genders, min_height, max_height,
+                           gender_code, edges):
+    """
+    Counts the heights like height_histogram, with a boolean mask and
+    np.histogram, for when numba is not installed.
+    """
+    mask = (heights >= min_height) & (heights <= max_height)
+    if gender_code != -1:
+        mask &= genders == gender_code
+    counts, _ = np.histogram(heights[mask], bins=edges)
+    return counts
+
 
 class MovieTypeRequest(BaseModel):
     """
@@ -53,9 +298,320 @@ class GenreFilter(BaseModel):
     genre: Optional[str] = None
 
 
+def create_session() -> requests.Session:
+    """
+    Creates an HTTP session that keeps connections to the data server alive
+    between requests and retries failed ones with exponential backoff.
+
+    Connection errors are retried only twice, so that a download on an
+    offline machine fails quickly.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retry = Retry(total=5, connect=2, backoff_factor=0.5,
+                  status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class MovieDataAnalyzer:
     """Class for downloading and analyzing movie data."""
+    # Shared by the downloads of all instances
+    _session = create_session()
+
+    @staticmethod
+    def _read_tsv(
+        file_path: str,
+        names: list[str],
+        dtype: Union[dict, type, str],
+        usecols: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Reads a headerless TSV file into a DataFrame using PyArrow.
+
+        The Arrow CSV reader tokenizes blocks of the file on multiple
+        threads. Rows with a wrong number of fields are skipped.
+
+        Args:
+            file_path (str): Path of the TSV file.
+            names (list[str]): Names of the columns in the file.
+            dtype (dict or type): Type of each column, or a single type for
+                all columns.
+            usecols (list[str], optional): Columns to keep. Default is all.
+
+        Returns:
+            pd.DataFrame: DataFrame with the parsed columns.
+        """
+        if not isinstance(dtype, dict):
+            dtype = dict.fromkeys(names, dtype)
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(
+                column_names=names, use_threads=True, block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(
+                delimiter="\t", quote_char=False,
+                invalid_row_handler=lambda row: "skip"),
+            convert_options=pacsv.ConvertOptions(
+                column_types={
+                    column: ARROW_TYPES[column_type]
+                    for column, column_type in dtype.items()
+                },
+                include_columns=usecols, null_values=[""],
+                strings_can_be_null=True))
+        return MovieDataAnalyzer._to_pandas(table, dtype)
+
     @staticmethod
+    def _to_pandas(table: pa.Table, dtype: dict) -> pd.DataFrame:
+        """
+        Converts an Arrow table of a data file into a DataFrame, keeping
+        the strings in Arrow buffers (see PANDAS_STRING_TYPES).
+
+        pandas writes string[pyarrow] columns to Parquet as large_string, so
+        the string columns are first cast back to the Arrow type declared
+        for them. A table read from the Parquet cache thus gets the same
+        dtypes as a freshly parsed one.
+
+        Args:
+            table (pa.Table): Columns of the data file.
+            dtype (dict): Declared type of each column, see DATA_FILES.
+
+        Returns:
+            pd.DataFrame: DataFrame with the columns of the table.
+        """
+        for index, field in enumerate(table.schema):
+            declared = ARROW_TYPES.get(dtype.get(field.name))
+            if field.type in PANDAS_STRING_TYPES and \
+                    declared in PANDAS_STRING_TYPES and field.type != declared:
+                table = table.set_column(
+                    index, field.name, table.column(index).cast(declared))
+        # Release each Arrow column as soon as it has been converted, so
+        # the file is not held in memory twice
+        return table.to_pandas(split_blocks=True, self_destruct=True,
+                               types_mapper=PANDAS_STRING_TYPES.get)
+
+    @staticmethod
+    def _load_file(dir_path: str, file: str) -> pd.DataFrame:
+        """
+        Loads one data file of the dataset into a DataFrame.
+
+        The parsed DataFrame is cached as a Parquet file in the
+        PARQUET_CACHE_DIR of the dataset, which is loaded instead of the
+        data file on later runs. The data file is parsed again if the cache
+        is unreadable or was written for another layout in DATA_FILES.
+
+        Args:
+            dir_path (str): Directory of the extracted dataset.
+            file (str): Name of the data file, a key of DATA_FILES.
+
+        Returns:
+            pd.DataFrame: DataFrame with the columns of the data file.
+        """
+        # The cache file is named after a hash of the layout of the data
+        # file, so a change of DATA_FILES does not load an outdated copy
+        data_file = DATA_FILES[file]
+        key = hashlib.sha1(
+            repr((PARQUET_CACHE_VERSION, data_file)).encode()).hexdigest()
+        cache_dir = os.path.join(dir_path, PARQUET_CACHE_DIR)
+        cache_name = f"{file}.{key[:16]}.parquet"
+        parquet_path = os.path.join(cache_dir, cache_name)
+
+        # Load the parsed DataFrame from the Parquet cache if it exists
+        if os.path.exists(parquet_path):
+            dtype = data_file.dtype if isinstance(data_file.dtype, dict) \
+                else dict.fromkeys(data_file.names, data_file.dtype)
+            try:
+                return MovieDataAnalyzer._to_pandas(
+                    pq.read_table(parquet_path, memory_map=True), dtype)
+            except (OSError, pa.ArrowException):
+                print(f"The cached {file} is unreadable, parsing it again.")
+
+        df = MovieDataAnalyzer._read_tsv(
+            os.path.join(dir_path, file), names=data_file.names,
+            dtype=data_file.dtype, usecols=data_file.usecols)
+        for column in data_file.dates:
+            df[column] = MovieDataAnalyzer.parse_dates(df[column])
+
+        # Cache the parsed DataFrame so later runs skip the TSV parsing. It
+        # is written to a temporary file first and then renamed, so an
+        # interrupted write never leaves a partial cache file behind.
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    dir=cache_dir, prefix=f"{file}.", suffix=".tmp",
+                    delete=False) as temp_file:
+                temp_path = temp_file.name
+            try:
+                df.to_parquet(temp_path, engine='pyarrow',
+                              compression=PARQUET_COMPRESSION)
+                os.replace(temp_path, parquet_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            # Remove the copies cached with an earlier layout
+            for name in MovieDataAnalyzer._list_files(cache_dir):
+                if name.startswith(f"{file}.") and \
+                        name.endswith(".parquet") and name != cache_name:
+                    os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            print(f"Could not cache the parsed {file}.")
+        return df
+
+    @staticmethod
+    def _list_files(dir_path: str) -> set[str]:
+        """
+        Names of the files in a directory, from a single directory scan
+        rather than a stat per file. Empty if the directory does not exist.
+        """
+        try:
+            with os.scandir(dir_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    @staticmethod
+    def _download_archive(
+        url: str,
+        tar_path: str,
+        etag: Optional[str] = None,
+        size: int = 0
+    ) -> None:
+        """
+        Downloads the tar.gz archive and extracts it next to tar_path.
+
+        With a parallel decompressor the archive is saved to tar_path first,
+        resuming a partial download of the same ETag left by an earlier run,
+        and removed once the extraction has succeeded. Otherwise an archive
+        of a known size up to SPOOL_MAX_SIZE is buffered in memory and then
+        extracted, and a larger one is extracted while it is downloaded.
+
+        Args:
+            url (str): URL of the archive.
+            tar_path (str): Local path of the archive.
+            etag (str, optional): ETag of the archive on the server.
+            size (int): Size of the archive on the server, 0 if unknown.
+        """
+        download_dir = os.path.dirname(tar_path)
+        tar_file_name = os.path.basename(tar_path)
+        if PARALLEL_GZIP:
+            # Parallel decompressors need the whole archive on disk
+            offset = os.path.getsize(tar_path) \
+                if os.path.exists(tar_path) else 0
+
+            # An archive left by an earlier run is only reused or resumed if
+            # it was downloaded for the current ETag of the archive
+            etag_path = f"{tar_path}.etag"
+            local_etag = None
+            if os.path.exists(etag_path):
+                with open(etag_path, encoding='utf-8') as file:
+                    local_etag = file.read()
+            if etag is None or local_etag != etag:
+                offset = 0
+
+            if size == 0 or offset != size:
+                headers = {}
+                if 0 < offset < size:
+                    # Resume the download, unless the archive has changed
+                    headers['Range'] = f'bytes={offset}-'
+                    if etag is not None:
+                        headers['If-Range'] = etag
+                response = MovieDataAnalyzer._session.get(
+                    url, headers=headers, stream=True, timeout=30)
+                response.raise_for_status()
+                mode = 'ab' if response.status_code == 206 else 'wb'
+                if mode == 'wb' and etag is not None:
+                    with open(etag_path, mode='w', encoding='utf-8') as file:
+                        file.write(etag)
+                print(f"Downloading {tar_file_name}...")
+                with open(tar_path, mode=mode,
+                          buffering=1024 * 1024) as file:
+                    if hasattr(os, 'posix_fadvise'):
+                        # The archive is written and read back sequentially
+                        os.posix_fadvise(file.fileno(), 0, 0,
+                                         os.POSIX_FADV_SEQUENTIAL)
+                    # Read from urllib3 directly, skipping the per-chunk
+                    # wrapping of iter_content
+                    for chunk in response.raw.stream(1024 * 1024,
+                                                     decode_content=True):
+                        file.write(chunk)
+                print("Download complete.")
+
+            # Extract the tarball
+            print(f"Extracting {tar_file_name}...")
+            MovieDataAnalyzer._extract_archive(tar_path, download_dir)
+
+            # Free the disk space of the archive once the data is extracted
+            dir_path = os.path.join(
+                download_dir,
+                os.path.splitext(os.path.splitext(tar_file_name)[0])[0])
+            if os.path.exists(os.path.join(dir_path, "movie.metadata.tsv")):
+                try:
+                    os.remove(tar_path)
+                    if os.path.exists(etag_path):
+                        os.remove(etag_path)
+                except OSError:
+                    print(f"Could not remove {tar_file_name}.")
+        else:
+            # The compressed archive never has to be written to disk
+            response = MovieDataAnalyzer._session.get(url, stream=True,
+                                                      timeout=30)
+            response.raise_for_status()
+            response.raw.decode_content = False
+            if 0 < size <= SPOOL_MAX_SIZE:
+                # Stream mode re-slices its buffer on every read, so a
+                # small archive is faster to buffer and extract seekably
+                print(f"Downloading {tar_file_name}...")
+                with tempfile.SpooledTemporaryFile(
+                        max_size=SPOOL_MAX_SIZE) as spool:
+                    shutil.copyfileobj(response.raw, spool, 1024 * 1024)
+                    spool.seek(0)
+                    print(f"Extracting {tar_file_name}...")
+                    with tarfile.open(fileobj=spool, mode='r:gz') as tar:
+                        tar.extractall(path=download_dir, filter="data")
+            else:
+                # Inflate and untar while downloading
+                print(f"Downloading and extracting {tar_file_name}...")
+                with tarfile.open(fileobj=response.raw, mode='r|gz',
+                                  bufsize=262144) as tar:
+                    tar.extractall(path=download_dir, filter="data")
+        print("Extraction complete.")
+
+    @staticmethod
+    def _extract_archive(tar_path: str, download_dir: str) -> None:
+        """
+        Extracts a tar.gz archive into the download directory.
+
+        If rapidgzip is installed the archive is inflated in parallel on all
+        available cores and untarred as a stream. Otherwise, if tar and pigz
+        are available, extraction is delegated to them. The standard library
+        single-threaded decompressor is used as a last resort.
+
+        Args:
+            tar_path (str): Path of the tar.gz archive.
+            download_dir (str): Directory to extract the archive into.
+        """
+        if rapidgzip is not None:
+            with rapidgzip.open(
+                tar_path, parallelization=os.cpu_count()
+            ) as gz, tarfile.open(fileobj=gz, mode='r|') as tar:
+                tar.extractall(path=download_dir, filter="data")
+        elif TAR_PATH and UNPIGZ_PATH:
+            subprocess.run([
+                TAR_PATH, "--use-compress-program=unpigz",
+                "-xf", tar_path, "-C", download_dir
+            ], check=True)
+        else:
+            with tarfile.open(tar_path, 'r:gz') as tar:
+                tar.extractall(path=download_dir, filter="data")
+
+    # Dates repeat a lot in the dataset (many share a year or a full date),
+    # so each distinct string is only parsed once
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
     def parse_date(
         date_str: Union[str, float, None]
     ) -> Optional[pd.Timestamp]:
@@ -85,25 +641,85 @@ class MovieDataAnalyzer:
                 continue
         return None
 
-    def __init__(self) -> None:
+    @staticmethod
+    def parse_dates(dates: pd.Series) -> pd.Series:
+        """
+        Parses a column of date strings into datetimes, like parse_date but
+        with one vectorized pass per format instead of a call per row.
+
+        Each format ('%Y-%m-%d', '%Y-%m', '%Y') is only tried on the dates
+        that the more specific formats could not parse.
+
+        Args:
+            dates (pd.Series): Date strings, missing values allowed.
+
+        Returns:
+            pd.Series: The datetimes, NaT where parsing fails.
+        """
+        # Remove any extra spaces
+        dates = dates.str.strip()
+        parsed = pd.to_datetime(dates, format='%Y-%m-%d', errors='coerce')
+        for fmt in ['%Y-%m', '%Y']:
+            unparsed = parsed.isna() & dates.notna()
+            if not unparsed.any():
+                break
+            parsed[unparsed] = pd.to_datetime(
+                dates[unparsed], format=fmt, errors='coerce')
+        return parsed
+
+    @staticmethod
+    def _count_integers(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Counts the occurrences of each value of an integer array.
+
+        The values span a small dense range (years, months, actors per
+        movie), so they are counted with np.bincount from the minimum value
+        instead of hashing them.
+
+        Args:
+            values (np.ndarray): Integer values.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The distinct values in ascending
+            order and the number of occurrences of each.
+        """
+        if values.size == 0:
+            return values, np.zeros(0, dtype=np.int64)
+        offset = values.min()
+        counts = np.bincount(values - offset)
+        present = np.flatnonzero(counts)
+        return present + offset, counts[present]
+
+    def __init__(
+        self,
+        url: str = 'http://www.cs.cmu.edu/~ark/personas/data/'
+                   'MovieSummaries.tar.gz',
+        download_dir: str = '../downloads'
+    ) -> None:
         """
         Initialize the MovieDataAnalyzer class.
 
+        Construction is cheap: the data is downloaded when it is first
+        needed and each DataFrame attribute is loaded on first access.
+
         Args:
             url: URL of the data file to download
+            download_dir: Directory to download and extract the data into
         """
-        # Instantiate dataframe attributes
-        self.characters: pd.DataFrame = pd.DataFrame()
-        self.movie_metadata: pd.DataFrame = pd.DataFrame()
-        self.name_clusters: pd.DataFrame = pd.DataFrame()
-        self.plot_summaries: pd.DataFrame = pd.DataFrame()
-        self.tvtropes_clusters: pd.DataFrame = pd.DataFrame()
-
         # Set the data URL
-        url = 'http://www.cs.cmu.edu/~ark/personas/data/MovieSummaries.tar.gz'
+        self._url = url
 
         # Set the download directory
-        download_dir = '../downloads'
+        self._download_dir = str(download_dir)
+
+    @cached_property
+    def _dir_path(self) -> str:
+        """
+        Directory of the extracted dataset, downloaded on first access if it
+        is missing or outdated.
+        """
+        url = self._url
+        download_dir = self._download_dir
 
         # Create the download directory if it doesn't exist
         if not os.path.exists(download_dir):
@@ -117,104 +733,210 @@ class MovieDataAnalyzer:
         tar_path = os.path.join(download_dir, tar_file_name)
         file_name = os.path.splitext(os.path.splitext(tar_file_name)[0])[0]
         dir_path = os.path.join(download_dir, file_name)
-        if not os.path.exists(dir_path):
-            # Download the file
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            print(f"Downloading {tar_file_name}...")
 
-            with open(tar_path, mode='wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        file.write(chunk)
-            print("Download complete.")
+        # Ask the server for the current version of the archive
+        remote_etag, remote_size, reachable = None, 0, False
+        try:
+            head = requests.head(url, timeout=VERSION_CHECK_TIMEOUT,
+                                 allow_redirects=True)
+            head.raise_for_status()
+            reachable = True
+            remote_etag = head.headers.get('ETag')
+            remote_size = int(head.headers.get('Content-Length', 0))
+        except requests.RequestException:
+            print("Could not check the data server for a newer version.")
 
-            # Extract the tarball
-            print(f"Extracting {file_name}...")
-            with tarfile.open(tar_path, 'r:gz') as tar:
-                tar.extractall(path=download_dir, filter="data")
-            print("Extraction complete.")
+        # The manifest is written once the archive has been fully extracted,
+        # so a missing or outdated one, or missing files, mean the data must
+        # be downloaded again
+        manifest_path = os.path.join(dir_path, MANIFEST_FILE)
+        manifest = None
+        present = MovieDataAnalyzer._list_files(dir_path)
+        if MANIFEST_FILE in present:
+            try:
+                with open(manifest_path, encoding='utf-8') as file:
+                    manifest = json.load(file)
+            except (OSError, ValueError):
+                print("The dataset manifest is unreadable.")
+        if manifest is None:
+            # Without a manifest, only trust existing data if the server
+            # cannot be reached to download it again
+            complete = bool(present) and not reachable
+        else:
+            local_etag, local_size = manifest.get('etag'), manifest.get('size')
+            complete = (
+                present.issuperset(manifest.get('files', [])) and
+                (remote_etag is None or remote_etag == local_etag) and
+                (not remote_size or not local_size or
+                 remote_size == local_size))
+        if not complete:
+            if os.path.exists(dir_path):
+                # Remove the incomplete or outdated data and cached files
+                shutil.rmtree(dir_path)
+            MovieDataAnalyzer._download_archive(
+                url, tar_path, remote_etag, remote_size)
+            manifest = {'etag': remote_etag, 'size': remote_size,
+                        'files': sorted(
+                            MovieDataAnalyzer._list_files(dir_path))}
+            with open(manifest_path, mode='w', encoding='utf-8') as file:
+                json.dump(manifest, file)
         else:
             print(f"File {os.path.basename(dir_path)} already exists.")
 
-        # Read each TSV file and create a DataFrame
-        for file in os.listdir(dir_path):
-            if file == "character.metadata.tsv":
-                file_path = os.path.join(dir_path, file)
-                ###
-                # Column names from README:
-                # 1. Wikipedia movie ID, 2. Freebase movie ID,
-                # 3. Movie release date, 4. Character name,
-                # 5. Actor date of birth, 6. Actor gender,
-                # 7. Actor height (in meters),
-                # 8. Actor ethnicity (Freebase ID), 9. Actor name,
-                # 10. Actor age at movie release,
-                # 11. Freebase character/actor map ID,
-                # 12. Freebase character ID, 13. Freebase actor ID
-                ###
-                df = pd.read_csv(file_path, sep="\t", names=[
-                    "wikipedia_movie_id", "freebase_movie_id",
-                    "movie_release_date", "character_name",
-                    "actor_date_of_birth", "actor_gender", "actor_height",
-                    "actor_ethnicity", "actor_name",
-                    "actor_age_at_movie_release",
-                    "freebase_character_actor_map_id",
-                    "freebase_character_id", "freebase_actor_id"
-                ], encoding="utf-8", on_bad_lines="skip")
-                self.characters = df  # Store as an attribute
-                self.characters['actor_date_of_birth'] = \
-                    self.characters['actor_date_of_birth'].apply(
-                        MovieDataAnalyzer.parse_date
-                )
-            elif file == "movie.metadata.tsv":
-                file_path = os.path.join(dir_path, file)
-                ###
-                # Column names from README:
-                # 1. Wikipedia movie ID, 2. Freebase movie ID, 3. Movie name,
-                # 4. Movie release date, 5. Movie box office revenue,
-                # 6. Movie runtime,
-                # 7. Movie languages (Freebase ID:name tuples),
-                # 8. Movie countries (Freebase ID:name tuples),
-                # 9. Movie genres (Freebase ID:name tuples)
-                ###
-                df = pd.read_csv(file_path, sep="\t", names=[
-                    "wikipedia_movie_id", "freebase_movie_id", "movie_name",
-                    "movie_release_date", "movie_box_office_revenue",
-                    "movie_runtime", "movie_languages", "movie_countries",
-                    "movie_genres"
-                ], encoding="utf-8", on_bad_lines="skip")
-                self.movie_metadata = df  # Store as an attribute
-                self.movie_metadata['movie_release_date'] = \
-                    self.movie_metadata['movie_release_date'].apply(
-                        MovieDataAnalyzer.parse_date
-                )
-            elif file == "name.clusters.txt":
-                file_path = os.path.join(dir_path, file)
-                # Column names from README: 1. Name, 2. Actor ID
-                df = pd.read_csv(file_path, sep="\t",
-                                 names=["name", "actor_id"], encoding="utf-8",
-                                 on_bad_lines="skip")
-                self.name_clusters = df
-            elif file == "plot_summaries.txt":
-                ###
-                # Column names from README:
-                # 1. Wikipedia movie ID, 2. Plot summary
-                ###
-                file_path = os.path.join(dir_path, file)
-                df = pd.read_csv(file_path, sep="\t",
-                                 names=["wikipedia_movie_id", "summary"],
-                                 encoding="utf-8", on_bad_lines="skip")
-                self.plot_summaries = df  # Store as an attribute
-            elif file == "tvtropes.clusters.txt":
-                # Column names from README: Cluster ID and Name
-                file_path = os.path.join(dir_path, file)
-                df = pd.read_csv(file_path, sep="\t",
-                                 names=["name", "cluster"], encoding="utf-8",
-                                 on_bad_lines="skip")
-                self.tvtropes_clusters = df  # Store as an attribute
-            else:
-                print(f"File {file} does not match any expected data file.")
-        print("All files have been loaded as DataFrame attributes.")
+        return dir_path
+
+    @cached_property
+    def dataset_version(self) -> Optional[str]:
+        """
+        ETag of the downloaded dataset archive, from its manifest, or None
+        if it is unknown. Changes whenever a new version is downloaded.
+        """
+        try:
+            with open(os.path.join(self._dir_path, MANIFEST_FILE),
+                      encoding='utf-8') as file:
+                return json.load(file).get('etag')
+        except (OSError, ValueError):
+            return None
+
+    def _load(self, file: str) -> pd.DataFrame:
+        """
+        Loads a data file of the dataset, or an empty DataFrame if the
+        dataset does not contain the file.
+        """
+        if not os.path.exists(os.path.join(self._dir_path, file)):
+            return pd.DataFrame()
+        return MovieDataAnalyzer._load_file(self._dir_path, file)
+
+    @cached_property
+    def characters(self) -> pd.DataFrame:
+        """Character metadata, loaded on first access."""
+        return self._load("character.metadata.tsv")
+
+    @cached_property
+    def movie_metadata(self) -> pd.DataFrame:
+        """Movie metadata, loaded on first access."""
+        return self._load("movie.metadata.tsv")
+
+    @cached_property
+    def name_clusters(self) -> pd.DataFrame:
+        """Name clusters of the characters, loaded on first access."""
+        return self._load("name.clusters.txt")
+
+    @cached_property
+    def plot_summaries(self) -> pd.DataFrame:
+        """Plot summaries of the movies, loaded on first access."""
+        return self._load("plot_summaries.txt")
+
+    @cached_property
+    def tvtropes_clusters(self) -> pd.DataFrame:
+        """TV Tropes clusters of the characters, loaded on first access."""
+        return self._load("tvtropes.clusters.txt")
+
+    def preload(self) -> None:
+        """
+        Load all DataFrame attributes now instead of on first access.
+
+        The data files are read concurrently, PyArrow releases the GIL while
+        parsing so the five files are parsed in parallel.
+        """
+        attributes = [data_file.attribute for data_file in DATA_FILES.values()]
+        _ = self._dir_path  # Download the dataset once, before the workers
+        with ThreadPoolExecutor(
+                max_workers=min(len(attributes), os.cpu_count() or 1)
+        ) as executor:
+            list(executor.map(lambda name: getattr(self, name), attributes))
+
+    @cached_property
+    def _genres(self) -> pa.ListArray:
+        """
+        Genre names of each movie as an Arrow list column, dictionary
+        encoded so that every distinct genre name is stored only once.
+        """
+        # Extract the genre names from the Freebase ID:name tuples with a
+        # single regex scan per distinct combination of genres, followed by
+        # an empty list for the movies without genres
+        genres = self.movie_metadata['movie_genres'].cat
+        genre_lists = pa.array(
+            [GENRE_PATTERN.findall(category) for category in genres.categories]
+            + [[]],
+            type=pa.list_(pa.dictionary(pa.int32(), pa.string())))
+        codes = genres.codes.to_numpy()
+        return genre_lists.take(
+            np.where(codes < 0, len(genres.categories), codes))
+
+    @cached_property
+    def _genre_index(self) -> dict[str, np.ndarray]:
+        """
+        Inverted index from each genre name to the sorted row positions of
+        its movies in movie_metadata.
+        """
+        # Pair every genre of every movie with the row of the movie, and
+        # group the rows by genre
+        genres = pc.list_flatten(self._genres).to_pandas().cat
+        codes = genres.codes.to_numpy()
+        rows = pc.list_parent_indices(self._genres).to_numpy()
+        order = np.lexsort((rows, codes))
+        codes, rows = codes[order], rows[order]
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        return {
+            genres.categories[codes[start]]: np.unique(movie_rows)
+            for start, movie_rows in zip(starts, np.split(rows, starts[1:]))
+        }
+
+    @cached_property
+    def _genre_counts(self) -> pd.DataFrame:
+        """
+        Number of movies of each genre, from most to least common.
+        """
+        # Count the occurrences of each genre with Arrow compute kernels
+        counts = pc.value_counts(pc.list_flatten(self._genres))
+        genre_counts = pd.DataFrame({
+            'movie_type': counts.field('values').to_pylist(),
+            'count': counts.field('counts').to_numpy()
+        })
+        return genre_counts.sort_values(
+            by='count', ascending=False, kind='stable', ignore_index=True)
+
+    @cached_property
+    def _actor_histogram(self) -> pd.DataFrame:
+        """
+        Number of movies for each number of actors.
+        """
+        # Count the number of actors per movie ID
+        movie_ids = self.characters['wikipedia_movie_id'].to_numpy(
+            dtype=np.int32)
+        _, actor_counts = np.unique(movie_ids, return_counts=True)
+
+        # Create a histogram of the actor counts, sorted by number of actors
+        number_of_actors, movie_count = MovieDataAnalyzer._count_integers(
+            actor_counts)
+        return pd.DataFrame({'number_of_actors': number_of_actors,
+                             'movie_count': movie_count})
+
+    @cached_property
+    def _heights(self) -> np.ndarray:
+        """
+        Actor heights as a contiguous float32 array, NaN if missing.
+        """
+        return self.characters['actor_height'].to_numpy(dtype=np.float32)
+
+    @cached_property
+    def _genders(self) -> np.ndarray:
+        """
+        Actor genders as int8 codes of _gender_code, -1 if missing.
+        """
+        # The column is loaded as a category, so its codes are already there
+        return self.characters['actor_gender'].cat.codes.to_numpy(
+            dtype=np.int8)
+
+    @cached_property
+    def _gender_code(self) -> dict[str, int]:
+        """
+        Code of each actor gender in _genders.
+        """
+        categories = self.characters['actor_gender'].cat.categories
+        return {str(category): code
+                for code, category in enumerate(categories)}
 
     def movie_type(self, request: MovieTypeRequest) -> pd.DataFrame:
         """
@@ -228,25 +950,7 @@ class MovieDataAnalyzer:
             the top n movie types.
         """
         n = request.n
-
-        # Split the movie genres into individual genres
-        genres: pd.Series = self.movie_metadata[
-            'movie_genres'].str.split(',').explode()
-
-        # Extract genres from the Freebase ID:name tuples
-        genres = genres.str.replace(r'["{},]', '', regex=True).str.strip()
-
-        # Split at space to extract the genre name
-        genres = genres.str.split(' ').str[-1]
-
-        # Transform the genre names to title case
-        genres = genres.str.title()
-
-        # Count the occurrences of each genre
-        genre_counts = genres.value_counts().head(n).reset_index()
-        genre_counts.columns = ['movie_type', 'count']
-
-        return genre_counts
+        return self._genre_counts.head(n).copy()
 
     def actor_count(self) -> pd.DataFrame:
         """
@@ -256,15 +960,7 @@ class MovieDataAnalyzer:
             pd.DataFrame: DataFrame with columns "Number_of_Actors" and
             "Movie_Count".
         """
-        # Group by movie ID and count the number of actors per movie
-        actor_counts = self.characters.groupby('wikipedia_movie_id').size()
-
-        # Create a histogram of the actor counts
-        actor_histogram = actor_counts.value_counts().reset_index()
-        actor_histogram.columns = ['number_of_actors', 'movie_count']
-        actor_histogram = actor_histogram.sort_values(by='number_of_actors')
-
-        return actor_histogram
+        return self._actor_histogram.copy()
 
     def actor_distributions(
             self, actor_filter: ActorFilter, plot: bool = False
@@ -280,8 +976,8 @@ class MovieDataAnalyzer:
             plot (bool): Plot the height distribution. Default is False.
 
         Returns:
-            pd.DataFrame: DataFrame with columns "Height" and "Count" for the
-            filtered actors.
+            pd.DataFrame: DataFrame with columns "Height" (bin centers) and
+            "Count" for the filtered actors.
         """
         if not actor_filter.height_valid:
             raise ValueError("max_height must be >= min_height")
@@ -289,37 +985,41 @@ class MovieDataAnalyzer:
         max_height = actor_filter.max_height
         min_height = actor_filter.min_height
 
-        # Filter the dataset by gender if specified
-        if gender != "All":
-            filtered_data = self.characters[
-                self.characters['actor_gender'] == gender]
-        else:
-            filtered_data = self.characters
+        # Bin the heights into a histogram, with the number of bins based on
+        # the range of heights
+        bins = max(int((max_height - min_height) * 50), 1)
+        edges = np.linspace(min_height-0.05, max_height+0.05, bins + 1)
 
-        # Filter the dataset by height range
-        filtered_data = filtered_data[
-            (filtered_data['actor_height'] <= max_height) &
-            (filtered_data['actor_height'] >= min_height)
-        ]
-
-        # Drop missing values in the height column
-        filtered_data = filtered_data.dropna(subset=['actor_height'])
-
-        # Create a histogram of the heights
-        height_counts = filtered_data['actor_height'].value_counts()
-        height_counts = height_counts.reset_index()
-        height_counts.columns = ['height', 'count']
-        height_counts = height_counts.sort_values(by='height')
+        # Filter the heights by range (in float32 precision, so the bounds
+        # are inclusive) and by gender if specified. Missing heights are NaN
+        # and fail both comparisons.
+        gender_code = -1 if gender == "All" \
+            else self._gender_code.get(gender, -2)
+        if height_histogram is not None:
+            # Filter and bin in one parallel pass without a boolean mask
+            configure_numba()
+            counts = height_histogram(
+                self._heights, self._genders, np.float32(min_height),
+                np.float32(max_height), gender_code, edges,
+                numba.get_num_threads())
+        else:
+            counts = numpy_height_histogram(
+                self._heights, self._genders, np.float32(min_height),
+                np.float32(max_height), gender_code, edges)
+        height_counts = pd.DataFrame({
+            'height': (edges[:-1] + edges[1:]) / 2,
+            'count': counts
+        })
 
         # Plot the height distribution if specified
         if plot:
-            # Calculate number of bins based on the range of heights
-            bins = int((max_height - min_height) * 50)
+            # Import pyplot here so that importing this module does not pay
+            # for loading matplotlib when nothing is plotted
+            import matplotlib.pyplot as plt
 
             plt.figure(figsize=(10, 6))
-            plt.hist(x=height_counts['height'], weights=height_counts['count'],
-                     bins=bins, range=(min_height-0.05, max_height+0.05),
-                     color='skyblue', density=False)
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    color='skyblue')
             plt.xlabel('Height (meters)')
             plt.ylabel('Count')
             plt.title(f'Height Distribution of Actors (Gender: {gender})')
@@ -346,31 +1046,25 @@ class MovieDataAnalyzer:
             raise TypeError("genre must be a string")
 
         # Check if genre is a valid genre
-        if genre:
-            valid_genres = self.movie_metadata[
-                'movie_genres'].str.extractall(r'\"([^\"]+)\"')[0].unique()
-            if genre not in valid_genres:
-                raise ValueError("Invalid genre")
+        if genre and genre not in self._genre_index:
+            raise ValueError("Invalid genre")
 
         # Create dataframe and extract the release year from the release date
         releases = pd.DataFrame()
         releases['movie_release_year'] = self.movie_metadata[
             'movie_release_date'].dt.year.astype('Int64')
 
-        # Copy the movie genres column
-        releases['movie_genres'] = self.movie_metadata['movie_genres']
-
-        # Filter by genre if specified
+        # Filter by genre if specified, looking up the movies of the genre
         if genre:
-            releases = releases[releases['movie_genres'].str.contains(genre)]
+            releases = releases.iloc[self._genre_index[genre]]
 
         # Drop rows with missing release years
         releases = releases.dropna(subset=['movie_release_year'])
 
-        # Count the number of movies released per year
-        releases = releases['movie_release_year'].value_counts().reset_index()
-        releases.columns = ['year', 'count']
-        releases = releases.sort_values(by='year')
+        # Count the number of movies released per year, sorted by year
+        years, counts = MovieDataAnalyzer._count_integers(
+            releases['movie_release_year'].to_numpy(dtype=np.int64))
+        releases = pd.DataFrame({'year': years, 'count': counts})
 
         # Sum all counts for all years
         total = releases['count'].sum()
@@ -392,34 +1086,31 @@ class MovieDataAnalyzer:
         if period not in ['Y', 'M']:
             raise ValueError("period must be 'Y' for year or 'M' for month")
 
-        # Drop rows with missing actor date of birth
-        valid_births = self.characters.dropna(subset=['actor_date_of_birth'])
+        # Work on the datetime64 buffer directly, dropping missing dates
+        births = self.characters['actor_date_of_birth'].to_numpy()
+        births = births[~np.isnat(births)]
 
         if period == 'Y':
             # Extract the year from the date of birth
-            valid_births['birth_year'] = valid_births[
-                                            'actor_date_of_birth'].dt.year
+            birth_years = births.astype('datetime64[Y]').astype(np.int64)
+            birth_years += 1970
             # Remove invalid birth years
-            valid_births = valid_births[valid_births['birth_year'] < 2025]
-            # Count the number of births per year
-            birth_counts = valid_births['birth_year'].value_counts(
-            ).reset_index()
-            birth_counts.columns = ['period', 'count']
-            birth_counts = birth_counts.sort_values(by='period')
+            birth_years = birth_years[birth_years < 2025]
+            # Count the number of births per year, sorted by year
+            years, counts = MovieDataAnalyzer._count_integers(birth_years)
+            birth_counts = pd.DataFrame({'period': years, 'count': counts})
         else:
             # Extract the month from the date of birth
-            valid_births['birth_month'] = valid_births[
-                                            'actor_date_of_birth'].dt.month
-            # Count the number of births per month
-            birth_counts = valid_births['birth_month'].value_counts(
-            ).reset_index()
-            birth_counts.columns = ['period', 'count']
-            birth_counts = birth_counts.sort_values(by='period')
+            birth_months = births.astype('datetime64[M]').astype(np.int64)
+            birth_months = birth_months % 12 + 1
+            # Count the number of births per month, sorted by month
+            months, counts = MovieDataAnalyzer._count_integers(birth_months)
+            birth_counts = pd.DataFrame({'period': months, 'count': counts})
             # Map period to month names
             month_names = ['January', 'February', 'March', 'April', 'May',
                            'June', 'July', 'August', 'September', 'October',
                            'November', 'December']
-            birth_counts['period'] = birth_counts['period'].map(
-                lambda x: month_names[x-1])
+            birth_counts['period'] = np.asarray(month_names, dtype=object)[
+                birth_counts['period'].to_numpy(dtype=np.int64) - 1]
 
         return birth_counts
@@ -1,5 +1,5 @@
 """
-new_app.py
+movie_data_app.py
 
 This Streamlit application provides a dashboard for movie data analysis using
 the `MovieDataAnalyzer` class. It includes visualizations for movie genre
@@ -8,8 +8,9 @@ over time, and actor birthdate distribution.
 
 Modules:
     streamlit: For creating the web application.
-    matplotlib.pyplot: For creating plots.
-    seaborn: For creating statistical visualizations.
+    altair: For creating bar charts.
+    matplotlib: For creating histograms.
+    scipy: For estimating the densities shown on the histograms.
     movie_data_analysis: Contains the `MovieDataAnalyzer` class for analyzing
     movie data.
 
@@ -20,8 +21,10 @@ Usage:
 Pages:
     Main Page: Displays visualizations for movie genre distribution, actor
     count per movie, and actor height distribution.
-    Movie Release Info: Displays visualizations for movie releases over time
+    Chronological Info: Displays visualizations for movie releases over time
     and actor birthdate distribution.
+    Classification: Classifies the genres of a random movie with a local
+    LLM and compares them with the genres in the dataset.
 
 Note:
     This app is built using the `MovieDataAnalyzer` class, loading and
@@ -29,13 +32,24 @@ Note:
 """
 
 import re
+import threading
+import time
+from functools import wraps
+from typing import Callable, Optional
+import altair as alt
+import numpy as np
+import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.ticker import FuncFormatter
+from scipy.stats import gaussian_kde
 from haystack import Pipeline
+from haystack.dataclasses import StreamingChunk
 from haystack.components.builders.prompt_builder import PromptBuilder
 from haystack_integrations.components.generators.ollama import OllamaGenerator
 from movie_data_analysis import (
+    GENRE_PATTERN,
     MovieDataAnalyzer,
     MovieTypeRequest,
     ActorFilter,
@@ -43,135 +57,571 @@ from movie_data_analysis import (
 )
 
 
-# Initialize the movie analysis module
-analyzer = MovieDataAnalyzer()
+def _profiled(func: Callable) -> Callable:
+    """
+    Records the number of calls of a cached function and the time they
+    take in st.session_state['timings'], so a cache that stops hitting
+    shows up as slow calls in the cache stats of the sidebar.
+
+    Args:
+        func (Callable): The cached function.
+
+    Returns:
+        Callable: The function, recording its calls.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        timings = st.session_state.setdefault('timings', {})
+        calls, total, slowest = timings.get(func.__name__, (0, 0.0, 0.0))
+        timings[func.__name__] = (
+            calls + 1, total + elapsed, max(slowest, elapsed))
+        return result
+    return wrapper
+
+
+@_profiled
+@st.cache_resource
+def get_analyzer() -> MovieDataAnalyzer:
+    """
+    Creates the movie analysis module once per server process.
+
+    The analyzer is shared by reference between all sessions and reruns,
+    so its data is downloaded and loaded only once. All data files are
+    loaded concurrently up front, instead of one by one as the pages first
+    need them.
+
+    Returns:
+        MovieDataAnalyzer: The shared analyzer.
+    """
+    movie_analyzer = MovieDataAnalyzer()
+    movie_analyzer.preload()
+    return movie_analyzer
+
+
+def _shrink(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Casts columns of a query result to the smallest types that hold them,
+    which shrinks the cached copies and the tables sent to the browser.
+
+    Args:
+        df (pd.DataFrame): Query result.
+        schema (dict): Type of each column to cast.
+
+    Returns:
+        pd.DataFrame: The query result with the cast columns.
+    """
+    return df.astype(schema, copy=False)
+
+
+# The query results are cached by their arguments, so reruns that do not
+# change the inputs of a plot reuse its data. The genre counts and releases
+# are also persisted to disk, so they survive restarts of the app. They are
+# keyed by the dataset version too, so a newly downloaded dataset is not
+# answered from the disk cache of the previous one.
+@_profiled
+@st.cache_data(persist="disk", max_entries=50)
+def _movie_type(n: int, version: Optional[str]) -> pd.DataFrame:
+    """
+    Top n movie genres of a dataset version, see
+    MovieDataAnalyzer.movie_type.
+    """
+    # The version is only part of the cache key
+    del version
+    return _shrink(get_analyzer().movie_type(MovieTypeRequest(n=n)),
+                   {'count': 'int32'})
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _actor_count() -> pd.DataFrame:
+    """Actor count histogram, see MovieDataAnalyzer.actor_count."""
+    return _shrink(get_analyzer().actor_count(),
+                   {'number_of_actors': 'int16', 'movie_count': 'int32'})
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _actor_hist_slice(x_limit: int) -> pd.DataFrame:
+    """Rows of the actor count histogram up to x_limit actors per movie."""
+    actor_histogram = _actor_count()
+    return actor_histogram.loc[
+        actor_histogram['number_of_actors'] <= x_limit,
+        ['number_of_actors', 'movie_count']].reset_index(drop=True)
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _actor_distributions(gender: str, min_height: float,
+                         max_height: float) -> pd.DataFrame:
+    """Actor height histogram, see MovieDataAnalyzer.actor_distributions."""
+    return _shrink(
+        get_analyzer().actor_distributions(ActorFilter(
+            gender=gender, max_height=max_height, min_height=min_height)),
+        {'height': 'float32', 'count': 'int32'})
+
+
+@_profiled
+@st.cache_data(persist="disk", max_entries=64)
+def _releases(genre: str, version: Optional[str]) -> pd.DataFrame:
+    """
+    Movie releases per year of a dataset version, see
+    MovieDataAnalyzer.releases.
+    """
+    # The version is only part of the cache key
+    del version
+    return _shrink(
+        get_analyzer().releases(genre_filter=GenreFilter(genre=genre)),
+        {'year': 'int16', 'count': 'int32'})
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _ages(period: str) -> pd.DataFrame:
+    """Actor births per period, see MovieDataAnalyzer.ages."""
+    # The periods are years or month names
+    schema = {'count': 'int32'}
+    if period == 'Y':
+        schema['period'] = 'int16'
+    return _shrink(get_analyzer().ages(period), schema)
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _kde(values: np.ndarray, weights: np.ndarray,
+         n: int = 256) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fits a Gaussian kernel density estimate to weighted values, with the
+    bandwidth of Scott's rule, and evaluates it on n points spanning them.
+
+    Args:
+        values (np.ndarray): Observed values.
+        weights (np.ndarray): Number of observations of each value.
+        n (int): Number of points to evaluate the density at. Default is 256.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The points and their densities, both
+        empty if the density cannot be estimated from the values.
+    """
+    observed = weights > 0
+    values, weights = values[observed], weights[observed]
+    if np.unique(values).size < 2:
+        return np.empty(0), np.empty(0)
+    kde = gaussian_kde(values, weights=weights, bw_method='scott')
+    xs = np.linspace(values.min(), values.max(), n)
+    return xs, kde(xs)
+
+
+@_profiled
+@st.cache_data(ttl=3600, max_entries=64)
+def _binned(values: np.ndarray, weights: np.ndarray,
+            edges: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bins weighted values into a histogram with the given bin edges.
+
+    Args:
+        values (np.ndarray): Observed values.
+        weights (np.ndarray): Number of observations of each value.
+        edges (np.ndarray): Edges of the equal-width bins.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The count of each bin and the bin
+        edges.
+    """
+    return np.histogram(values, bins=edges, weights=weights)
+
+
+def plot_histogram(ax: Axes, values: np.ndarray, weights: np.ndarray,
+                   edges: np.ndarray, color: str) -> None:
+    """
+    Draws the histogram of weighted values with their kernel density
+    estimate, scaled to the counts of its bins. Both are cached per data,
+    so a rerun only draws them.
+
+    The values are already aggregated, so the edges should match the bins
+    they were counted in, rather than bins inferred from the values.
+
+    Args:
+        ax (Axes): Axes to draw on.
+        values (np.ndarray): Observed values.
+        weights (np.ndarray): Number of observations of each value.
+        edges (np.ndarray): Edges of the equal-width bins of the histogram.
+        color (str): Color of the bars and the line.
+    """
+    counts, edges = _binned(values, weights, edges)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           color=color, edgecolor='black', alpha=0.75)
+
+    xs, density = _kde(values, weights)
+    if xs.size:
+        ax.plot(xs, density * weights.sum() * (edges[1] - edges[0]),
+                color=color)
+
+
+def show_table(df: pd.DataFrame, key: str, count_column: str) -> bool:
+    """
+    Shows a toggle that replaces a plot with a table of its data, which the
+    browser renders without any drawing on the server.
+
+    Args:
+        df (pd.DataFrame): Data of the plot.
+        key (str): Unique key of the toggle.
+        count_column (str): Column with the counts, shown as integers.
+
+    Returns:
+        bool: True if the table was shown instead of the plot.
+    """
+    if not st.toggle("Show as table", key=key):
+        return False
+    st.dataframe(df, use_container_width=True, hide_index=True,
+                 column_config={
+                     count_column: st.column_config.NumberColumn(format="%d")
+                 })
+    return True
+
+
+def bar_chart(  # pylint: disable=too-many-arguments
+        df: pd.DataFrame, xcol: str, ycol: str, title: str, color: str, *,
+        xlabel: str, ylabel: str, sort: Optional[str] = None,
+        xtype: str = 'O') -> alt.Chart:
+    """
+    Creates a bar chart of one column of a DataFrame against another.
+
+    The chart is rendered by the browser from the data Streamlit sends it,
+    so the server does not have to draw an image on every rerun.
+
+    Args:
+        df (pd.DataFrame): Data to plot.
+        xcol (str): Column with the bar labels.
+        ycol (str): Column with the bar heights.
+        title (str): Title of the plot.
+        color (str): Color of the bars.
+        xlabel (str): Label of the x-axis.
+        ylabel (str): Label of the y-axis.
+        sort (str, optional): Sort order of the bars, e.g. '-y' for
+            descending heights. Default is the order of the rows.
+        xtype (str, optional): Altair type of the x column, 'O' for one
+            label per bar or 'Q' for a numeric axis, e.g. of years, that
+            spans the range of the values and leaves gaps for the missing
+            ones. Default is 'O'.
+
+    Returns:
+        alt.Chart: The bar chart.
+    """
+    if xtype == 'Q':
+        # Span the values instead of starting at zero, and label them
+        # without thousands separators
+        x = alt.X(f'{xcol}:Q', title=xlabel, scale=alt.Scale(zero=False),
+                  axis=alt.Axis(format='d', tickMinStep=1))
+    else:
+        # Rotate the x-axis labels for better readability
+        x = alt.X(f'{xcol}:{xtype}', title=xlabel, sort=sort,
+                  axis=alt.Axis(labelAngle=-45))
+    return alt.Chart(df, title=title).mark_bar(color=color).encode(
+        x=x,
+        # The heights are counts, so only integer ticks make sense
+        y=alt.Y(f'{ycol}:Q', title=ylabel, axis=alt.Axis(tickMinStep=1)))
+
+
+@_profiled
+@st.cache_resource
+def get_summary_index() -> pd.Series:
+    """
+    Indexes the plot summaries by movie ID once per server process, so a
+    summary is found by a hash lookup instead of a scan of all summaries.
+    Only the first summary of a movie is kept.
+
+    Returns:
+        pd.Series: The summary of each movie ID.
+    """
+    summaries = get_analyzer().plot_summaries.drop_duplicates(
+        'wikipedia_movie_id')
+    return summaries.set_index('wikipedia_movie_id')['summary']
+
+
+# Local LLM that classifies the movies
+LLM_MODEL = "deepseek-r1:1.5B"
+
+# Reasoning of the LLM, which is removed from its replies
+_THINK_RE = re.compile(r"<think>.*?</think>\s*", re.DOTALL)
+
+# Tag at the end of a partial reply, which may be the start of a <think>
+_PARTIAL_TAG_RE = re.compile(r"<[^>]*$")
+
+# Receiver of the reply chunks of the LLM. The pipelines are shared by all
+# sessions, and each session runs its script in its own thread, so it is set
+# per thread while a pipeline runs.
+_llm_stream = threading.local()
+
+# Prompt that asks the LLM for the genres of a movie
+PROMPT = """
+Given only the following information, answer the question.
+Classify the genres of the movie based on the title and the
+summary.
+You can classify multiple genres.\n
+ONLY print the names of Genres, separated by commas.\n
+Do not include any other information in the response.\n\n
+Example output: Action, Adventure, Comedy\n
+Title: {{movie_title}}
+Summary: {{movie_summary}}
+"""
 
-# Navigation to pages
-st.sidebar.title("Navigation")
-page = st.sidebar.radio(
-    "Go to", ["Main Page", "Chronological Info", "Classification"])
+# Follow-up prompt that asks the LLM to compare its genres with the actual
+# genres of the movie
+FOLLOWUP_PROMPT = """
+Given only the following information, answer the question.
+Does one of the classified genres match at least one of the actual
+genres of the movie?
+Your classification: {{classified_genres}}\n
+Actual genres: {{actual_genres}}\n
+
+ONLY write the one of the following responses.
+Your response should not contain any other information.\n\n
+
+If at least one classifed genre EXACTLY matches a genre in the
+actual genres, write:\n
+'I correctly classified one or more genres'.\n\n
+
+If none of the classified genres matches the actual genres,
+write:\n
+'I did not correctly classify any genres'.
+"""
 
-if page == "Main Page":
-    # Streamlit App Title
-    st.title("Movie Analysis Dashboard")
 
-    # Plot 1: Movie Genre Distribution
+def _stream_chunk(chunk: StreamingChunk) -> None:
+    """
+    Streaming callback of the LLM, which passes each chunk of a reply to the
+    receiver of the script run in this thread, if there is one.
+
+    Args:
+        chunk (StreamingChunk): The next part of the reply.
+    """
+    receiver = getattr(_llm_stream, 'receiver', None)
+    if receiver is not None:
+        receiver(chunk.content)
+
+
+def run_streamed(pipe: Pipeline, data: dict) -> dict:
+    """
+    Runs an LLM pipeline while showing its reply as it is generated, so the
+    first words appear long before the whole reply is done. The reasoning
+    of the LLM is not shown.
+
+    Args:
+        pipe (Pipeline): Pipeline with an LLM that streams its reply.
+        data (dict): Inputs of the pipeline.
+
+    Returns:
+        dict: Outputs of the pipeline.
+    """
+    placeholder = st.empty()
+    parts = []
+
+    def show(content: str) -> None:
+        parts.append(content)
+        # Hide the reasoning until the LLM closes its <think> tag
+        reply = _THINK_RE.sub("", "".join(parts)).split("<think>")[0]
+        reply = _PARTIAL_TAG_RE.sub("", reply)
+        placeholder.text(reply or "Thinking...")
+
+    _llm_stream.receiver = show
+    try:
+        return pipe.run(data)
+    finally:
+        _llm_stream.receiver = None
+        placeholder.empty()
+
+
+@_profiled
+@st.cache_resource
+def get_classify_pipeline() -> Pipeline:
+    """
+    Builds the pipeline that classifies the genres of a movie once per
+    server process, so a shuffle only runs it.
+
+    Returns:
+        Pipeline: The prompt builder connected to the LLM.
+    """
+    pipe = Pipeline()
+    pipe.add_component("prompt_builder", PromptBuilder(
+        template=PROMPT,
+        required_variables=["movie_title", "movie_summary"]))
+    pipe.add_component("llm", OllamaGenerator(
+        model=LLM_MODEL, streaming_callback=_stream_chunk))
+
+    # Connect the components
+    pipe.connect("prompt_builder", "llm")
+    return pipe
+
+
+@_profiled
+@st.cache_resource
+def get_followup_pipeline() -> Pipeline:
+    """
+    Builds the pipeline that evaluates the classified genres once per
+    server process.
+
+    Returns:
+        Pipeline: The follow-up prompt builder connected to the LLM.
+    """
+    pipe_followup = Pipeline()
+    pipe_followup.add_component(
+        "followup_prompt_builder",
+        PromptBuilder(template=FOLLOWUP_PROMPT,
+                      required_variables=[
+                          "classified_genres",
+                          "actual_genres"
+                          ]))
+    pipe_followup.add_component("llm", OllamaGenerator(
+        model=LLM_MODEL, streaming_callback=_stream_chunk))
+    pipe_followup.connect("followup_prompt_builder", "llm")
+    return pipe_followup
+
+
+# Each plot is a fragment, so a change of its widgets only reruns the plot
+# itself, not the other plots of the page.
+@st.fragment
+def _plot_genres() -> None:
+    """Shows the counts of the top n movie genres."""
     st.subheader("Movie Genre Distribution")
     try:
         n = st.number_input("Select number of Genres",
                             min_value=1, max_value=50, value=5,
                             key="genre_n")
 
-        movie_type_request = MovieTypeRequest(n=n)
         # Get the top n movie genres from the analyzer
-        genre_counts = analyzer.movie_type(movie_type_request)
+        genre_counts = _movie_type(n, get_analyzer().dataset_version)
 
         # Create a plot
-        fig1, ax1 = plt.subplots()
-        ax1.bar(genre_counts['movie_type'],
-                genre_counts['count'], color='skyblue')
+        chart1 = bar_chart(genre_counts, 'movie_type', 'count',
+                           "Top Movie Genres", 'skyblue',
+                           xlabel="Movie Genre", ylabel="Count", sort='-y')
 
-        # Set labels and title
-        ax1.set_ylabel("Count")
-        ax1.set_xlabel("Movie Genre")
-        ax1.set_title("Top Movie Genres")
-
-        # Rotate x-axis labels for better readability
-        ax1.set_xticklabels(
-            genre_counts['movie_type'], rotation=45, ha='right')
-
-        # Display plot in Streamlit
-        st.pyplot(fig1)
+        # Display plot in Streamlit, or its data as a table
+        if not show_table(genre_counts, "genre_table", 'count'):
+            st.altair_chart(chart1, use_container_width=True)
     except (KeyError, ValueError) as e:
         st.error(f"Error processing movie genre data: {e}")
 
-    # Plot 2: Actor Count Per Movie
+
+@st.fragment
+def _plot_actor_counts() -> None:
+    """Shows the distribution of the number of actors per movie."""
     st.subheader("Actor Count Per Movie")
     try:
         # Use the actor_count method instead of direct data access
-        actor_histogram = analyzer.actor_count()
+        actor_histogram = _actor_count()
 
         # Calculate reasonable x-axis limits based on data
         max_actors = actor_histogram['number_of_actors'].max()
         # Limit to 50 actors max for better visibility
         x_limit = min(max_actors, 50)
 
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        sns.histplot(
-            data=actor_histogram[
-                actor_histogram['number_of_actors'] <= x_limit],
-            x='number_of_actors', weights='movie_count', bins=25, kde=True,
-            ax=ax2, color='lightcoral')
-
-        ax2.set_xlabel("Number of Actors per Movie")
-        ax2.set_ylabel("Number of Movies")
-        ax2.set_title("Actor Count Distribution (up to 50 actors)")
-
-        # Format y-axis to use K for thousands
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(
-            lambda x, p: f'{int(x/1000)}K' if x >= 1000 else str(int(x))))
-
-        # Add grid for better readability
-        ax2.grid(True, alpha=0.3)
-
-        st.pyplot(fig2)
+        actor_hist_slice = _actor_hist_slice(int(x_limit))
+        if not show_table(actor_hist_slice, "actor_count_table",
+                          'movie_count'):
+            fig2 = Figure(figsize=(10, 6))
+            ax2 = fig2.add_subplot()
+            # One bin per number of actors, centered on it
+            number_of_actors = actor_hist_slice['number_of_actors'].to_numpy()
+            low, high = number_of_actors.min(), number_of_actors.max()
+            edges = np.linspace(low - 0.5, high + 0.5, high - low + 2)
+            plot_histogram(
+                ax2, number_of_actors,
+                actor_hist_slice['movie_count'].to_numpy(), edges,
+                'lightcoral')
+
+            ax2.set_xlabel("Number of Actors per Movie")
+            ax2.set_ylabel("Number of Movies")
+            ax2.set_title("Actor Count Distribution (up to 50 actors)")
+
+            # Format y-axis to use K for thousands
+            ax2.yaxis.set_major_formatter(FuncFormatter(
+                lambda x, p: f'{int(x/1000)}K' if x >= 1000 else str(int(x))))
+
+            # Add grid for better readability
+            ax2.grid(True, alpha=0.3)
+
+            st.pyplot(fig2)
     except (KeyError, ValueError) as e:
         st.error(f"Error processing actor count data: {e}")
 
-    # Plot 3: Actor Height Distribution
+
+@st.fragment
+def _plot_heights() -> None:
+    """Shows the distribution of actor heights, filtered in a form."""
     st.subheader("Actor Height Distribution")
     try:
-        gender = st.selectbox("Select Gender", ["All", "M", "F"])
-        min_height = st.number_input(
-            "Min Height (meters)", min_value=1.0, max_value=2.5, value=1.5)
-        max_height = st.number_input(
-            "Max Height (meters)", min_value=1.0, max_value=2.5, value=2.0)
-
-        actor_filter = ActorFilter(gender=gender,
-                                   max_height=max_height,
-                                   min_height=min_height)
+        # Batch the edits of the filters in a form, so the distribution is
+        # only recomputed when they are submitted, not on every keystroke
+        with st.form("height_form"):
+            gender = st.selectbox("Select Gender", ["All", "M", "F"])
+            min_height = st.number_input(
+                "Min Height (meters)", min_value=1.0, max_value=2.5,
+                value=1.5)
+            max_height = st.number_input(
+                "Max Height (meters)", min_value=1.0, max_value=2.5,
+                value=2.0)
+            st.form_submit_button("Update")
+
+        if min_height > max_height:
+            raise ValueError("Min height must not exceed max height.")
+
         # Use the actor_distributions method
-        height_counts = analyzer.actor_distributions(actor_filter)
-
-        fig3, ax3 = plt.subplots()
-        sns.histplot(data=height_counts, x='height', weights='count',
-                     bins=20, kde=True, ax=ax3, color='seagreen')
-        ax3.set_xlabel("Height (meters)")
-        ax3.set_ylabel("Frequency")
-        ax3.set_title(f"Height Distribution for {gender}")
-        st.pyplot(fig3)
+        height_counts = _actor_distributions(gender, min_height, max_height)
+
+        if not show_table(height_counts, "height_table", 'count'):
+            fig3 = Figure()
+            ax3 = fig3.add_subplot()
+            # The bins the analyzer counted the heights in
+            edges = np.linspace(min_height - 0.05, max_height + 0.05,
+                                len(height_counts) + 1)
+            plot_histogram(ax3, height_counts['height'].to_numpy(),
+                           height_counts['count'].to_numpy(), edges,
+                           'seagreen')
+            ax3.set_xlabel("Height (meters)")
+            ax3.set_ylabel("Frequency")
+            ax3.set_title(f"Height Distribution for {gender}")
+            st.pyplot(fig3)
     except (KeyError, ValueError) as e:
         st.error(f"Error processing actor height data: {e}")
 
-if page == "Chronological Info":
-    st.title("Chronological Information about the Movies")
 
-    # Display Movie Releases Over Time
+@st.fragment
+def _plot_releases() -> None:
+    """Shows the number of movies released per year, of one genre."""
     st.subheader("Movie Releases Over Time")
 
-    # Input for genre selection
-    selected_genre = st.text_input("Enter Genre")
+    # Input for genre selection, only queried once it is submitted. All
+    # movies are counted while it is empty.
+    with st.form("genre_form"):
+        selected_genre = st.text_input("Enter Genre").strip()
+        st.form_submit_button("Show")
 
     try:
-        genre_filter = GenreFilter(genre=selected_genre)
         # Get chronological data for the selected genre
-        data = analyzer.releases(genre_filter=genre_filter)
+        data = _releases(selected_genre, get_analyzer().dataset_version)
 
         # Create a bar plot
-        fig4, ax4 = plt.subplots()
-        ax4.bar(data['year'], data['count'], color='dodgerblue')
-
-        # Set labels and title
-        ax4.set_ylabel("Count")
-        ax4.set_xlabel("Year")
-        ax4.set_title(f"Number of {selected_genre} Movies Over Time")
-
-        # Display plot in Streamlit
-        st.pyplot(fig4)
+        title = f"Number of {selected_genre} Movies Over Time" \
+            if selected_genre else "Number of Movies Over Time"
+        chart4 = bar_chart(data, 'year', 'count', title,
+                           'dodgerblue', xlabel="Year", ylabel="Count",
+                           xtype='Q')
+
+        # Display plot in Streamlit, or its data as a table
+        if not show_table(data, "releases_table", 'count'):
+            st.altair_chart(chart4, use_container_width=True)
     except (KeyError, ValueError) as e:
         st.error(f"Error processing chronological data: {e}")
 
-    # Display Actor birthdate distribution
+
+@st.fragment
+def _plot_births() -> None:
+    """Shows the number of actors born per year or month."""
     st.subheader("Actor Birthdate Distribution")
 
     try:
@@ -183,35 +633,22 @@ if page == "Chronological Info":
         selected_period = period_map[selected_period]
 
         # Get birthdate data
-        birthdate_data = analyzer.ages(selected_period)
-        # Dynamically change the number of bins based on the period
-        bins = birthdate_data['period'].nunique()
+        birthdate_data = _ages(selected_period)
 
         # Create a plot
-        fig5, ax5 = plt.subplots()
-        ax5.bar(birthdate_data['period'],
-                birthdate_data['count'], color='salmon')
-
-        # Set labels and title
         if selected_period == "Y":
-            ax5.set_xlabel("Birth Year")
-            ax5.set_title("Actor Birth Year Distribution")
-            ax5.set_xlim(
-                birthdate_data['period'].min(), birthdate_data['period'].max())
+            chart5 = bar_chart(birthdate_data, 'period', 'count',
+                               "Actor Birth Year Distribution", 'salmon',
+                               xlabel="Birth Year", ylabel="Frequency",
+                               xtype='Q')
         else:
-            ax5.set_xlabel("Birth Month")
-            ax5.set_title("Actor Birth Month Distribution")
-            ax5.set_ylim(0)
-            ax5.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
-
-            # Rotate x-axis labels for better readability
-            ax5.set_xticklabels(
-                birthdate_data['period'], rotation=45, ha='right')
-
-        ax5.set_ylabel("Frequency")
+            chart5 = bar_chart(birthdate_data, 'period', 'count',
+                               "Actor Birth Month Distribution", 'salmon',
+                               xlabel="Birth Month", ylabel="Frequency")
 
-        # Display plot in Streamlit
-        st.pyplot(fig5)
+        # Display plot in Streamlit, or its data as a table
+        if not show_table(birthdate_data, "births_table", 'count'):
+            st.altair_chart(chart5, use_container_width=True)
 
         # Add note Actors with unknown birth months are shown in January
         if selected_period == "M":
@@ -222,6 +659,54 @@ if page == "Chronological Info":
     except (KeyError, ValueError) as e:
         st.error(f"Error processing birthdate data: {e}")
 
+
+@_profiled
+@st.cache_resource
+def prewarm_queries() -> None:
+    """
+    Runs the queries behind the initial view of every page once per server
+    process, with the default inputs of their widgets, so switching to a
+    page for the first time finds its plots already cached.
+    """
+    version = get_analyzer().dataset_version
+    _movie_type(5, version)
+    _actor_count()
+    _actor_distributions("All", 1.5, 2.0)
+    _releases("", version)
+    _ages("Y")
+
+
+# Initialize the movie analysis module, and the cached plot data
+analyzer = get_analyzer()
+prewarm_queries()
+
+# Navigation to pages
+st.sidebar.title("Navigation")
+page = st.sidebar.radio(
+    "Go to", ["Main Page", "Chronological Info", "Classification"])
+
+if page == "Main Page":
+    # Streamlit App Title
+    st.title("Movie Analysis Dashboard")
+
+    # Plot 1: Movie Genre Distribution
+    _plot_genres()
+
+    # Plot 2: Actor Count Per Movie
+    _plot_actor_counts()
+
+    # Plot 3: Actor Height Distribution
+    _plot_heights()
+
+if page == "Chronological Info":
+    st.title("Chronological Information about the Movies")
+
+    # Display Movie Releases Over Time
+    _plot_releases()
+
+    # Display Actor birthdate distribution
+    _plot_births()
+
 if page == "Classification":
     st.title("Classification of Movies")
 
@@ -232,68 +717,36 @@ if page == "Classification":
     if st.button("Shuffle"):
         try:
             # Get a random movie title and summary
-            random_movie = analyzer.movie_metadata.sample(1)
-            movie_title = random_movie['movie_name'].values[0]
+            movies = analyzer.movie_metadata
+            random_movie = movies.iloc[np.random.randint(len(movies))]
+            movie_title = random_movie['movie_name']
 
             # Get the wikipedia movie id
-            movie_id = random_movie['wikipedia_movie_id'].values[0]
-
-            # Get the plot summary
-            movie_summary = analyzer.plot_summaries.loc[
-                analyzer.plot_summaries[
-                    'wikipedia_movie_id'] == movie_id, 'summary']
-
-            if not movie_summary.empty:
-                MOVIE_SUMMARY = movie_summary.values[0]
-            else:
-                MOVIE_SUMMARY = "Summary not available."
+            movie_id = random_movie['wikipedia_movie_id']
 
-            # Extract the genres from the movie data
-            movie_genres = random_movie['movie_genres'].str.extractall(
-                r'\"([^\"]+)\"')[0].unique()
+            # Look up the plot summary by movie ID
+            movie_summary = get_summary_index().get(
+                movie_id, "Summary not available.")
 
-            # Remove genre ids
-            movie_genres = [
-                genre for genre in movie_genres if not genre.startswith('/m/')]
+            # Extract the genre names (without their Freebase IDs) from the
+            # movie data, with the pattern the analyzer counts genres with
+            genres = random_movie['movie_genres']
+            movie_genres = list(dict.fromkeys(GENRE_PATTERN.findall(
+                genres if isinstance(genres, str) else "")))
 
             # Display the movie title
             st.text_area("Movie Title and Summary",
-                         movie_title + "\n\n" + MOVIE_SUMMARY)
+                         movie_title + "\n\n" + movie_summary)
 
             # Display the genres from the database
             st.text_area("Genres in Database:", ", ".join(movie_genres))
 
             # Use a local LLM to classify the movie summary
-
-            # Prepare the prompt for the LLM
-            PROMPT = """
-            Given only the following information, answer the question.
-            Classify the genres of the movie based on the title and the
-            summary.
-            You can classify multiple genres.\n
-            ONLY print the names of Genres, separated by commas.\n
-            Do not include any other information in the response.\n\n
-            Example output: Action, Adventure, Comedy\n
-            Title: {{movie_title}}
-            Summary: {{movie_summary}}
-            """
-
-            # Initialize pipeline
-            pipe = Pipeline()
-            pipe.add_component("prompt_builder", PromptBuilder(
-                template=PROMPT,
-                required_variables=["movie_title", "movie_summary"]))
-            pipe.add_component("llm", OllamaGenerator(
-                model="deepseek-r1:1.5B"))
-
-            # Connect the components
-            pipe.connect("prompt_builder", "llm")
-
-            # Run the pipeline
-            response = pipe.run({"prompt_builder": {
-                "movie_title": movie_title,
-                "movie_summary": movie_summary
-            }
+            response = run_streamed(get_classify_pipeline(), {
+                "prompt_builder": {
+                    "movie_title": movie_title,
+                    "movie_summary": movie_summary
+                }
             })
 
             # Extract the classified genres
@@ -301,49 +754,13 @@ if page == "Classification":
 
             # Display the classified genres
             if "<think>" in classified_genres:
-                classified_genres = re.sub(
-                    r"<think>.*?</think>\s*", "",
-                    classified_genres, flags=re.DOTALL)
+                classified_genres = _THINK_RE.sub("", classified_genres)
 
             # Display the classified genres
             st.text_area("Classified Genres by LLM", classified_genres)
 
-            # Create follow-up question
-            # Follow up prompt
-            FOLLOWUP_PROMPT = """
-            Given only the following information, answer the question.
-            Does one of the classified genres match at least one of the actual
-            genres of the movie?
-            Your classification: {{classified_genres}}\n
-            Actual genres: {{actual_genres}}\n
-
-            ONLY write the one of the following responses.
-            Your response should not contain any other information.\n\n
-
-            If at least one classifed genre EXACTLY matches a genre in the
-            actual genres, write:\n
-            'I correctly classified one or more genres'.\n\n
-
-            If none of the classified genres matches the actual genres,
-            write:\n
-            'I did not correctly classify any genres'.
-            """
-
-            # Initialize the follow-up pipeline
-            pipe_followup = Pipeline()
-            pipe_followup.add_component(
-                "followup_prompt_builder",
-                PromptBuilder(template=FOLLOWUP_PROMPT,
-                              required_variables=[
-                                  "classified_genres",
-                                  "actual_genres"
-                                  ]))
-            pipe_followup.add_component(
-                "llm", OllamaGenerator(model="deepseek-r1:1.5B"))
-            pipe_followup.connect("followup_prompt_builder", "llm")
-
             # Run the follow-up pipeline
-            followup_response = pipe_followup.run({
+            followup_response = run_streamed(get_followup_pipeline(), {
                 "followup_prompt_builder": {
                     "classified_genres": classified_genres,
                     "actual_genres": movie_genres
@@ -355,10 +772,20 @@ if page == "Classification":
 
             # If response contains <think> tags, clean up the respons
             if "<think>" in evaluation:
-                evaluation = re.sub(r"<think>.*?</think>\s*",
-                                    "", evaluation, flags=re.DOTALL)
+                evaluation = _THINK_RE.sub("", evaluation)
 
             # Display the evaluation
             st.text_area("Evaluation", evaluation)
         except (KeyError, ValueError, RuntimeError) as e:
             st.error(f"Error classifying movie: {e}")
+
+# Developer view of the calls of the cached functions in this session. Cache
+# hits take about a millisecond, so a slow mean time points at a cache that
+# misses.
+if st.sidebar.checkbox("Cache stats"):
+    cache_stats = pd.DataFrame.from_dict(
+        st.session_state.get('timings', {}), orient='index',
+        columns=['calls', 'total_s', 'slowest_s'])
+    cache_stats['mean_ms'] = \
+        cache_stats['total_s'] / cache_stats['calls'] * 1000
+    st.sidebar.dataframe(cache_stats.sort_index())
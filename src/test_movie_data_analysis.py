@@ -9,75 +9,222 @@ different conditions and input values.
 
 Tested Methods:
 - movie_type: Tests for handling invalid types, negative values, zero values,
-and large values.
+and large values, and for counting the full genre names.
 - actor_distributions: Tests for handling invalid gender types, invalid height
-types, and invalid height ranges.
+types, and invalid height ranges, and for the numba and numpy histograms.
+- releases: Tests for filtering by the exact genre name and rejecting
+Freebase IDs.
+- parse_dates: Tests that the vectorized parser agrees with parse_date.
+- _load_file: Tests of the Parquet cache of the parsed data files.
+- _dir_path: Tests of the download of the dataset from a local HTTP server,
+its version check and its reuse.
+
+The error handling tests are parametrized, with one case per invalid input.
 
 The tests ensure that the methods in the MovieDataAnalyzer class raise
-appropriate exceptions (TypeError, ValueError) when provided with invalid
-input and return expected results for valid input.
+appropriate exceptions (ValidationError, ValueError) when provided with
+invalid input and return expected results for valid input.
 
 Usage:
 - To run these tests, use the pytest framework by executing `pytest` in the
 terminal.
 """
+import io
+import json
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pandas as pd
 import pytest
+from pydantic import ValidationError
+import movie_data_analysis
 from movie_data_analysis import (
+    DATA_FILES,
+    PARQUET_CACHE_DIR,
     MovieDataAnalyzer,
     MovieTypeRequest,
-    ActorFilter
+    ActorFilter,
+    GenreFilter
     )
 
-# Create an instance of the MovieDataAnalyzer class
-analyzer = MovieDataAnalyzer()
+# The loading and downloading tests check the private helpers behind the
+# lazily loaded DataFrames
+# pylint: disable=protected-access
+
+# A few rows of each data file of the dataset, in the layout of the README
+SAMPLE_DATASET = {
+    "character.metadata.tsv": (
+        "1\t/m/01\t2001-05-04\tAnna\t1970-02-03\tF\t1.65\t/m/e1\t"
+        "Jane Doe\t31\t/m/c1\t/m/ch1\t/m/a1\n"
+        "1\t/m/01\t2001-05-04\tBob\t1965\tM\t1.82\t\t"
+        "John Roe\t36\t/m/c2\t/m/ch2\t/m/a2\n"
+        "2\t/m/02\t1999\tCarl\t\t\t\t\tMax Poe\t\t/m/c3\t/m/ch3\t/m/a3\n"
+    ),
+    "movie.metadata.tsv": (
+        '1\t/m/01\tFirst Movie\t2001-05-04\t1000000\t95.0\t'
+        '{"/m/l1": "English Language"}\t{"/m/k1": "United States"}\t'
+        '{"/m/g1": "Drama", "/m/g2": "Romantic comedy"}\n'
+        '2\t/m/02\tSecond Movie\t1999\t\t101.5\t'
+        '{"/m/l1": "English Language"}\t{"/m/k2": "Germany"}\t'
+        '{"/m/g3": "Comedy"}\n'
+    ),
+    "name.clusters.txt": "Anna\t/m/c1\nBob\t/m/c2\n",
+    "plot_summaries.txt": "1\tA plot about the first movie.\n",
+    "tvtropes.clusters.txt": (
+        'hero\t{"char": "Anna", "movie": "First Movie", "id": "/m/c1", '
+        '"actor": "Jane Doe"}\n'
+    ),
+}
+
+
+def write_dataset(dir_path):
+    """
+    Writes the SAMPLE_DATASET files into a directory.
 
-# Test Error Handling
+    Args:
+        dir_path: Directory to write the data files into.
+    """
+    os.makedirs(dir_path, exist_ok=True)
+    for file, content in SAMPLE_DATASET.items():
+        with open(os.path.join(dir_path, file), "w", encoding="utf-8") as f:
+            f.write(content)
 
 
-def test_movie_type_invalid_n():
+def make_archive(version):
     """
-    Test that the movie_type function raises a TypeError when the parameter n
-    is given an invalid type (string instead of integer).
+    Packs SAMPLE_DATASET and a README with the version into a tar.gz
+    archive like the one on the data server. The archive is uncompressed
+    inside the gzip stream, so archives of all versions have the same size.
 
-    This test uses pytest to check that the function correctly handles invalid
-    input by raising the appropriate exception.
+    Args:
+        version (str): Version written into the README, one character.
 
-    Raises:
-        TypeError: If the parameter n is not of the expected type.
+    Returns:
+        bytes: The archive.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=0) as tar:
+        files = {**SAMPLE_DATASET, "README.txt": f"version {version}\n"}
+        for file, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(f"MovieSummaries/{file}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class DataServer(ThreadingHTTPServer):
+    """
+    Local HTTP server of the dataset archive, with an ETag and support for
+    resuming downloads. The method of every request is logged.
+    """
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), DataRequestHandler)
+        self.archive, self.etag, self.log = b"", None, []
+        self.url = f"http://127.0.0.1:{self.server_port}/" \
+            "MovieSummaries.tar.gz"
+
+    def publish(self, version):
+        """Serves the archive of a version, with the ETag of the version."""
+        self.archive, self.etag = make_archive(version), f'"{version}"'
+
+
+class DataRequestHandler(BaseHTTPRequestHandler):
+    """Answers the HEAD and GET requests of DataServer."""
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """Sends the headers of the archive."""
+        self.server.log.append("HEAD")
+        self._send_headers(200, len(self.server.archive))
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Sends the archive, or its requested end if it is unchanged."""
+        self.server.log.append("GET")
+        archive = self.server.archive
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == self.server.etag:
+            archive = archive[int(range_header[6:].rstrip("-")):]
+            self._send_headers(206, len(archive))
+        else:
+            self._send_headers(200, len(archive))
+        self.wfile.write(archive)
+
+    def _send_headers(self, status, length):
+        self.send_response(status)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keeps the test output free of the request log."""
+
+
+@pytest.fixture(name="data_server")
+def fixture_data_server():
     """
-    with pytest.raises(TypeError):
-        analyzer.movie_type(MovieTypeRequest(n="ten"))
+    Runs a DataServer in a background thread for the duration of a test.
+
+    Yields:
+        DataServer: The running server.
+    """
+    server = DataServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def dataset_version(dir_path):
+    """Version in the README of an extracted dataset."""
+    with open(os.path.join(dir_path, "README.txt"), encoding="utf-8") as f:
+        return f.read().split()[-1]
 
 
-def test_movie_type_negative_value():
+@pytest.fixture(name="sample_analyzer")
+def fixture_sample_analyzer(tmp_path):
     """
-    Test that the movie_type method raises a ValueError when passed a negative
-    value.
+    Creates a MovieDataAnalyzer of the SAMPLE_DATASET files.
 
-    This test ensures that the movie_type method in the analyzer object
-    correctly handles invalid input by raising a ValueError when the parameter
-    n is negative.
+    Returns:
+        MovieDataAnalyzer: The analyzer.
     """
-    with pytest.raises(ValueError):
-        analyzer.movie_type(MovieTypeRequest(n=-1))
+    write_dataset(tmp_path)
+    sample = MovieDataAnalyzer()
+    sample._dir_path = str(tmp_path)
+    return sample
 
+# Test Error Handling
+
+# The tests that take the analyzer fixture share one analyzer of the full
+# dataset, see conftest.py. The others build their own from SAMPLE_DATASET.
 
-def test_movie_type_zero_value():
+
+@pytest.mark.parametrize("n, exception", [
+    ("ten", ValidationError),
+    (-1, ValueError),
+    (0, ValueError),
+], ids=["invalid_n", "negative_value", "zero_value"])
+def test_movie_type_invalid(analyzer, n, exception):
     """
-    Test that the movie_type method raises a ValueError when called with n=0.
+    Test that the movie_type method raises an exception for invalid values
+    of the parameter n.
 
-    This test ensures that the movie_type method in the analyzer object
-    correctly handles the case where the input value n is zero, which is
-    expected to raise a ValueError.
+    This test checks each case of the parametrization: an invalid type
+    (string instead of integer) must be rejected by pydantic with a
+    ValidationError, while a negative or zero value must raise a ValueError.
 
     Raises:
-        ValueError: If the input value n is zero.
+        ValidationError: If the parameter n is not of the expected type.
+        ValueError: If the parameter n is not positive.
     """
-    with pytest.raises(ValueError):
-        analyzer.movie_type(MovieTypeRequest(n=0))
+    with pytest.raises(exception):
+        analyzer.movie_type(MovieTypeRequest(n=n))
 
 
-def test_movie_type_large_value():
+@pytest.mark.slow
+def test_movie_type_large_value(analyzer):
     """
     Test the movie_type function with a large value for n.
 
@@ -91,105 +238,373 @@ def test_movie_type_large_value():
     assert 'movie_type' in result
 
 
-def test_actor_distributions_invalid_gender():
+@pytest.mark.parametrize("gender, max_height, min_height, exception", [
+    (123, 2.0, 1.5, ValidationError),
+    ("M", "tall", 1.5, ValidationError),
+    ("M", 1.0, 1.5, ValueError),
+    ("M", 0, 1.5, ValueError),
+    ("M", 2.5, 3.5, ValueError),
+], ids=["invalid_gender", "invalid_height_type", "invalid_height_range",
+        "zero_max_height", "heights_out_of_range"])
+def test_actor_distributions_invalid(analyzer, gender, max_height,
+                                     min_height, exception):
     """
-    Test the actor_distributions function with an invalid gender type.
+    Test that the actor_distributions method raises an exception for invalid
+    filters.
 
-    This test ensures that the actor_distributions function raises a TypeError
-    when the gender parameter is provided with an invalid type (e.g., an
-    integer).
+    This test checks each case of the parametrization: a gender or height of
+    an invalid type (e.g. an integer gender or a string height) must be
+    rejected by pydantic with a ValidationError, while a minimum height above
+    the maximum height, or heights outside the valid range, must raise a
+    ValueError.
 
     Raises:
-        TypeError: If the gender parameter is not of the expected type.
+        ValidationError: If a filter parameter is not of the expected type.
+        ValueError: If the height range is invalid.
     """
-    with pytest.raises(TypeError):
-        actor_filter = ActorFilter(gender=123, max_height=2.0, min_height=1.5)
+    with pytest.raises(exception):
+        actor_filter = ActorFilter(gender=gender,
+                                   max_height=max_height,
+                                   min_height=min_height)
         analyzer.actor_distributions(actor_filter)
 
+# Test Functionality
+
 
-def test_actor_distributions_invalid_height_type():
+def test_movie_type(analyzer):
     """
-    Test that the actor_distributions function raises a TypeError when an
-    invalid type is provided for the max_height parameter.
+    Test the movie_type function from the analyzer module.
 
-    This test ensures that the function correctly handles the case where the
-    max_height parameter is given a string value instead of a numeric value.
+    This test checks if the movie_type function returns the correct movie type
+    for a given input. Specifically, it verifies that when n=10, the genre
+    names in the 'movie_type' column include "Drama".
 
     Raises:
-        TypeError: If the max_height parameter is not of a numeric type.
+        AssertionError: If the returned movie type does not match the expected
+        value.
     """
-    with pytest.raises(TypeError):
-        actor_filter = ActorFilter(gender="M",
-                                   max_height="tall",
-                                   min_height=1.5)
-        analyzer.actor_distributions(actor_filter)
+    result = analyzer.movie_type(MovieTypeRequest(n=10))
+    assert any("Drama" in movie for movie in result['movie_type'])
 
 
-def test_actor_distributions_invalid_height_range():
+def test_movie_type_genre_names(sample_analyzer):
     """
-    Test that the `actor_distributions` method raises a ValueError when the
-    minimum height is greater than the maximum height.
+    Test that movie_type counts the full genre names of the Freebase
+    ID:name tuples, and counts a genre only for the movies that have
+    exactly that genre.
 
-    This test ensures that the `actor_distributions` method correctly handles
-    invalid height ranges by raising a ValueError when `min_height` is greater
-    than `max_height`.
+    Raises:
+        AssertionError: If a genre name is changed or miscounted.
+    """
+    result = sample_analyzer.movie_type(MovieTypeRequest(n=10))
+    assert dict(zip(result['movie_type'], result['count'])) == {
+        "Drama": 1, "Romantic comedy": 1, "Comedy": 1}
+
+
+@pytest.mark.parametrize("genre, years", [
+    ("Comedy", [1999]),
+    ("Romantic comedy", [2001]),
+    ("Drama", [2001]),
+    (None, [1999, 2001]),
+])
+def test_releases_genre(sample_analyzer, genre, years):
+    """
+    Test that releases only counts the movies of exactly the given genre.
 
     Raises:
-        ValueError: If the `actor_distributions` method does not raise a
-        ValueError when `min_height` is greater than `max_height`.
+        AssertionError: If the movies of another genre are counted.
     """
-    with pytest.raises(ValueError):
-        actor_filter = ActorFilter(gender="M", max_height=1.0, min_height=1.5)
-        analyzer.actor_distributions(actor_filter)
+    result = sample_analyzer.releases(GenreFilter(genre=genre))
+    assert result['year'].tolist() == years
+    assert result['count'].tolist() == [1] * len(years)
 
 
-def test_actor_distributions_invalid_height_values():
+@pytest.mark.parametrize("genre", ["/m/g3", "comedy", "Romantic"])
+def test_releases_invalid_genre(sample_analyzer, genre):
     """
-    Test the actor_distributions function for invalid height values.
+    Test that releases rejects Freebase IDs and names that are not exactly
+    a genre name.
 
-    This test checks that the actor_distributions function raises a ValueError
-    when provided with invalid height ranges. Specifically, it tests the
-    following cases:
-    1. max_height is less than min_height.
-    2. Both max_height and min_height are outside the valid range.
+    Raises:
+        AssertionError: If no "Invalid genre" error is raised.
+    """
+    with pytest.raises(ValueError, match="Invalid genre"):
+        sample_analyzer.releases(GenreFilter(genre=genre))
 
-    The function is expected to raise a ValueError in both cases.
+
+def test_actor_distributions(analyzer):
     """
-    with pytest.raises(ValueError):
-        actor_filter = ActorFilter(gender="M", max_height=0, min_height=1.5)
-        analyzer.actor_distributions(actor_filter)
+    Test the actor_distributions function from the analyzer module.
 
-    with pytest.raises(ValueError):
-        actor_filter = ActorFilter(gender="M", max_height=2.5, min_height=3.5)
-        analyzer.actor_distributions(actor_filter)
+    This test checks if the actor_distributions function returns the correct
+    distribution of"
+    """
+    actor_filter = ActorFilter(gender="M", max_height=2.0, min_height=1.5)
+    result = analyzer.actor_distributions(actor_filter)
+    assert 'height' in result
 
-# Test Functionality
 
+@pytest.mark.parametrize("histogram", [
+    pytest.param(
+        movie_data_analysis.height_histogram, id="numba",
+        marks=pytest.mark.skipif(movie_data_analysis.numba is None,
+                                 reason="numba is not installed")),
+    pytest.param(movie_data_analysis.numpy_height_histogram, id="numpy"),
+])
+@pytest.mark.parametrize("gender_code", [-1, -2, 0, 1])
+def test_height_histogram(histogram, gender_code):
+    """
+    Test that the numba kernel and the numpy fallback count heights into
+    the same bins as np.histogram, including heights on the bin edges and
+    missing heights and genders.
 
-def test_movie_type():
+    Raises:
+        AssertionError: If the counts differ from np.histogram.
     """
-    Test the movie_type function from the analyzer module.
+    rng = np.random.default_rng(0)
+    min_height, max_height = np.float32(1.2), np.float32(2.0)
+    edges = np.linspace(min_height - 0.05, max_height + 0.05, 21)
+    heights = np.concatenate([
+        rng.uniform(1.0, 2.2, 10_000), edges, [np.nan] * 10
+    ]).astype(np.float32)
+    genders = rng.integers(-1, 2, heights.size).astype(np.int8)
+
+    if histogram is movie_data_analysis.height_histogram:
+        movie_data_analysis.configure_numba()
+        counts = histogram(heights, genders, min_height, max_height,
+                           gender_code, edges, 4)
+    else:
+        counts = histogram(heights, genders, min_height, max_height,
+                           gender_code, edges)
+
+    mask = (heights >= min_height) & (heights <= max_height)
+    if gender_code != -1:
+        mask &= genders == gender_code
+    expected, _ = np.histogram(heights[mask], bins=edges)
+    np.testing.assert_array_equal(counts, expected)
+
+
+@pytest.mark.parametrize("dtype", ["string[pyarrow]", object])
+def test_parse_dates_matches_parse_date(dtype):
+    """
+    Test that the vectorized parse_dates parses every kind of release date
+    like parse_date, including dates out of the datetime range and
+    unparsable ones.
 
-    This test checks if the movie_type function returns the correct movie type
-    for a given input. Specifically, it verifies that when n=1, the function
-    returns a dictionary where the 'movie_type' key corresponds to the value
-    '"/m/07s9rl0": "Drama"'.
+    Raises:
+        AssertionError: If a date is parsed differently.
+    """
+    dates = pd.Series([
+        "1999-05-01", "1999-05", "1999", " 1999-05-01 ", " 2004 ", "",
+        None, "1010", "1010-12-02", "garbage", "1999-13", "May 1999"
+    ], dtype=dtype)
+
+    parsed = MovieDataAnalyzer.parse_dates(dates)
+
+    expected = pd.Series(
+        [MovieDataAnalyzer.parse_date(date) for date in dates],
+        dtype="datetime64[ns]")
+    pd.testing.assert_series_equal(parsed, expected)
+
+
+# Test Loading
+
+
+@pytest.mark.parametrize("file", list(DATA_FILES))
+def test_load_file_cache_keeps_dtypes(tmp_path, file):
+    """
+    Test that a data file loaded from the Parquet cache has the same columns
+    and dtypes as when it is parsed from the TSV file.
+
+    The string columns in particular must stay in Arrow buffers, rather than
+    coming back as Python strings from the cache.
 
     Raises:
-        AssertionError: If the returned movie type does not match the expected
-        value.
+        AssertionError: If the cold and warm loads differ.
     """
-    result = analyzer.movie_type(MovieTypeRequest(n=10))
-    assert any("Drama" in movie for movie in result['movie_type'])
+    write_dataset(tmp_path)
+    cold = MovieDataAnalyzer._load_file(str(tmp_path), file)
+    warm = MovieDataAnalyzer._load_file(str(tmp_path), file)
 
+    assert cold.dtypes.to_dict() == warm.dtypes.to_dict()
+    pd.testing.assert_frame_equal(cold, warm)
 
-def test_actor_distributions():
+
+def test_load_file_unreadable_cache(tmp_path):
     """
-    Test the actor_distributions function from the analyzer module.
+    Test that a truncated Parquet cache file, e.g. left by a crash while it
+    was written, is replaced by parsing the data file again.
 
-    This test checks if the actor_distributions function returns the correct
-    distribution of"
+    Raises:
+        AssertionError: If the data is not loaded or the cache not rewritten.
     """
-    actor_filter = ActorFilter(gender="M", max_height=2.0, min_height=1.5)
-    result = analyzer.actor_distributions(actor_filter)
-    assert 'height' in result
+    write_dataset(tmp_path)
+    file = "movie.metadata.tsv"
+    expected = MovieDataAnalyzer._load_file(str(tmp_path), file)
+    cache_dir = tmp_path / PARQUET_CACHE_DIR
+    (cache_file,) = cache_dir.glob(f"{file}.*.parquet")
+    cache_file.write_bytes(cache_file.read_bytes()[:10])
+
+    result = MovieDataAnalyzer._load_file(str(tmp_path), file)
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(
+        MovieDataAnalyzer._load_file(str(tmp_path), file), expected)
+    assert sorted(p.name for p in cache_dir.iterdir()) == [cache_file.name]
+
+
+def test_load_file_cache_follows_layout(tmp_path, monkeypatch):
+    """
+    Test that changing the layout of a data file in DATA_FILES ignores and
+    replaces the DataFrame cached with the previous layout.
+
+    Raises:
+        AssertionError: If the outdated cached DataFrame is loaded.
+    """
+    write_dataset(tmp_path)
+    file = "character.metadata.tsv"
+    MovieDataAnalyzer._load_file(str(tmp_path), file)
+
+    data_files = dict(DATA_FILES)
+    data_files[file] = DATA_FILES[file]._replace(
+        usecols=DATA_FILES[file].usecols + ["actor_name"],
+        dtype={**DATA_FILES[file].dtype, "actor_name": str})
+    monkeypatch.setattr(movie_data_analysis, "DATA_FILES", data_files)
+    result = MovieDataAnalyzer._load_file(str(tmp_path), file)
+
+    assert "actor_name" in result
+    cache_dir = tmp_path / PARQUET_CACHE_DIR
+    assert len(list(cache_dir.glob(f"{file}.*.parquet"))) == 1
+
+
+# Test Downloading
+
+
+def test_download_discards_archive_of_other_version(data_server, tmp_path,
+                                                    monkeypatch):
+    """
+    Test that an archive left by an earlier run, e.g. after a failed
+    extraction, is downloaded again instead of extracted when the server
+    has another version of the same size.
+
+    Raises:
+        AssertionError: If the data of the old archive is extracted.
+    """
+    monkeypatch.setattr(movie_data_analysis, "PARALLEL_GZIP", True)
+    data_server.publish("2")
+    old_archive = make_archive("1")
+    assert len(old_archive) == len(data_server.archive)
+    (tmp_path / "MovieSummaries.tar.gz").write_bytes(old_archive)
+
+    dir_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+
+    assert dataset_version(dir_path) == "2"
+    assert data_server.log == ["HEAD", "GET"]
+    assert not (tmp_path / "MovieSummaries.tar.gz").exists()
+
+
+@pytest.mark.parametrize("spool_max_size", [
+    0, movie_data_analysis.SPOOL_MAX_SIZE
+], ids=["stream", "buffered"])
+def test_download_without_parallel_gzip(data_server, tmp_path, monkeypatch,
+                                        spool_max_size):
+    """
+    Test that without a parallel decompressor the archive is extracted
+    while it is downloaded, or from memory if it is small enough, without
+    being written to disk.
+
+    Raises:
+        AssertionError: If the dataset is not extracted.
+    """
+    monkeypatch.setattr(movie_data_analysis, "PARALLEL_GZIP", False)
+    monkeypatch.setattr(movie_data_analysis, "SPOOL_MAX_SIZE", spool_max_size)
+    data_server.publish("1")
+
+    dir_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+
+    assert dataset_version(dir_path) == "1"
+    assert data_server.log == ["HEAD", "GET"]
+    assert sorted(os.listdir(tmp_path)) == ["MovieSummaries"]
+    assert len(MovieDataAnalyzer._load_file(dir_path,
+                                            "movie.metadata.tsv")) == 2
+
+
+def test_dir_path_manifest_matches(data_server, tmp_path):
+    """
+    Test that a dataset whose manifest matches the server is not
+    downloaded again.
+
+    Raises:
+        AssertionError: If the archive is downloaded again.
+    """
+    data_server.publish("1")
+    first_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+    assert dataset_version(first_path) == "1"
+    data_server.log.clear()
+
+    dir_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+
+    assert data_server.log == ["HEAD"]
+    assert dataset_version(dir_path) == "1"
+
+
+def test_dir_path_etag_changed(data_server, tmp_path):
+    """
+    Test that a new version of the dataset on the server is downloaded and
+    recorded in the manifest, which gives the dataset_version.
+
+    Raises:
+        AssertionError: If the old dataset is kept.
+    """
+    data_server.publish("1")
+    first_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+    assert dataset_version(first_path) == "1"
+    data_server.publish("2")
+    data_server.log.clear()
+
+    local = MovieDataAnalyzer(data_server.url, tmp_path)
+    dir_path = local._dir_path
+
+    assert data_server.log == ["HEAD", "GET"]
+    assert dataset_version(dir_path) == "2"
+    with open(os.path.join(dir_path, movie_data_analysis.MANIFEST_FILE),
+              encoding="utf-8") as f:
+        assert json.load(f)["etag"] == '"2"'
+    assert local.dataset_version == '"2"'
+
+
+def test_dir_path_unreachable_with_manifest(data_server, tmp_path):
+    """
+    Test that a downloaded dataset is used as it is when the server cannot
+    be reached.
+
+    Raises:
+        AssertionError: If the dataset is removed.
+    """
+    data_server.publish("1")
+    url = data_server.url
+    first_path = MovieDataAnalyzer(url, tmp_path)._dir_path
+    assert dataset_version(first_path) == "1"
+    data_server.shutdown()
+    data_server.server_close()
+
+    dir_path = MovieDataAnalyzer(url, tmp_path)._dir_path
+
+    assert dataset_version(dir_path) == "1"
+
+
+def test_dir_path_reachable_without_manifest(data_server, tmp_path):
+    """
+    Test that data without a manifest, e.g. left by an interrupted
+    extraction, is replaced by a download when the server can be reached.
+
+    Raises:
+        AssertionError: If the data without a manifest is kept.
+    """
+    data_server.publish("1")
+    write_dataset(tmp_path / "MovieSummaries")
+
+    dir_path = MovieDataAnalyzer(data_server.url, tmp_path)._dir_path
+
+    assert data_server.log == ["HEAD", "GET"]
+    assert dataset_version(dir_path) == "1"